@@ -1,7 +1,11 @@
 import streamlit as st
 import os
-import importlib.util
-import sys
+import time
+import queue
+import hashlib
+import multiprocessing
+
+import runner
 
 st.set_page_config(
     page_title="AoC 2025 - AI Pair Programming",
@@ -29,24 +33,132 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def file_mtime(path):
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+# Module, source and input are cached per (path, mtime): editing a file invalidates
+# its entry, while plain widget reruns reuse them. cache_resource hands back the
+# same objects instead of unpickling a copy, which matters for large inputs.
+@st.cache_resource(show_spinner=False)
+def cached_module(day_num, path, mtime):
+    return runner.load_day_module(day_num)
+
+@st.cache_resource(show_spinner=False)
+def cached_text(path, mtime):
+    if mtime is None:
+        return ""
+    with open(path, 'r') as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False)
+def cached_line_count(path, mtime):
+    # Count newlines in place instead of building a list with splitlines()
+    text = cached_text(path, mtime)
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+@st.cache_data(show_spinner=False)
+def cached_input_hash(path, mtime):
+    return hashlib.sha256(cached_text(path, mtime).encode()).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def result_store():
+    """Finished runs shared by all sessions, keyed by result_key()."""
+    return {}
+
+def result_key(day_num, backend):
+    """(day, input hash, backend, source mtime): any change to them means a fresh run."""
+    input_file = runner.input_path(day_num)
+    script_path = runner.script_path(day_num)
+    return (day_num, cached_input_hash(input_file, file_mtime(input_file)),
+            backend, file_mtime(script_path))
+
+# Background runs: one worker process per session, streaming progress events
+# (see runner.solve_day_streaming) that each rerun drains into the job's DayResult.
+POLL_SECONDS = 0.2
+
+def start_job(day_num, backend, parts, key):
+    cancel_job()
+    # spawn: forking the Streamlit server's threads is unsafe
+    context = multiprocessing.get_context("spawn")
+    events = context.Queue()
+    process = context.Process(target=runner.solve_day_streaming,
+                              args=(day_num, backend, parts, events))
+    process.start()
+    st.session_state.job = {
+        "key": key,
+        "parts": parts,
+        "process": process,
+        "events": events,
+        "result": runner.DayResult(backend=backend),
+        "started": time.perf_counter(),
+        "status": "running",
+        "parsed": False,
+        "error": None,
+    }
+
+def cancel_job():
+    job = st.session_state.get("job")
+    if job and job["status"] == "running":
+        job["process"].terminate()
+        job["process"].join()
+        job["status"] = "cancelled"
+
+def drain_job(job):
+    """Apply queued progress events; store the result once the run finishes."""
+    while job["status"] == "running":
+        try:
+            event = job["events"].get_nowait()
+        except queue.Empty:
+            if not job["process"].is_alive():
+                # Exited without "done": drain any last events, then give up
+                try:
+                    event = job["events"].get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    job["status"] = "failed"
+                    job["error"] = f"Worker exited with code {job['process'].exitcode}"
+                    return
+            else:
+                return
+
+        kind, payload = event[0], event[1]
+        if kind == "backend":
+            job["result"].backend = payload
+        elif kind == "parse":
+            job["result"].parse_wall = payload
+            job["parsed"] = True
+        elif kind == "part":
+            job["result"].parts[payload] = event[2]
+        elif kind == "error":
+            job["status"] = "failed"
+            job["error"] = payload
+        elif kind == "done":
+            job["status"] = "done"
+            job["process"].join()
+            result_store()[job["key"]] = job["result"]
+
+def show_day_result(day_result, cached=False):
+    for part, result in day_result.parts.items():
+        if result.error:
+            st.error(f"Part {part} Error: {result.error}")
+        elif part == 1:
+            st.success(f"**Part 1 Result:** {result.answer}")
+        else:
+            st.info(f"**Part {part} Result:** {result.answer}")
+
+    timings = [f"parse {runner.format_ms(day_result.parse_wall)}"]
+    timings += [f"part {part} {runner.format_ms(r.wall)} (cpu {runner.format_ms(r.cpu)})"
+                for part, r in day_result.parts.items()]
+    backend = "" if day_result.backend == runner.DEFAULT_BACKEND else f" · {day_result.backend}"
+    st.caption("⏱️ " + " · ".join(timings) + backend + (" · ⚡ cached" if cached else ""))
+
 def load_day_module(day_num):
-    day_dir = f"day{day_num}"
-    script_path = os.path.join(day_dir, f"day{day_num}.py")
-    input_path = os.path.join(day_dir, f"day{day_num}_input.txt")
-    
+    script_path = runner.script_path(day_num)
     if not os.path.exists(script_path):
         return None, None, None
 
-    spec = importlib.util.spec_from_file_location(f"day{day_num}", script_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[f"day{day_num}"] = module
-    spec.loader.exec_module(module)
-    
-    input_text = ""
-    if os.path.exists(input_path):
-        with open(input_path, 'r') as f:
-            input_text = f.read()
-            
+    module = cached_module(day_num, script_path, file_mtime(script_path))
+    input_text = cached_text(runner.input_path(day_num), file_mtime(runner.input_path(day_num)))
+
     return module, input_text, script_path
 
 # Sidebar
@@ -77,28 +189,65 @@ if module:
         st.subheader("📝 Input Data")
         with st.expander("View Input File", expanded=False):
             st.code(input_text[:1000] + ("..." if len(input_text) > 1000 else ""))
-            st.caption(f"Total lines: {len(input_text.splitlines())}")
+            input_file = runner.input_path(selected_day)
+            st.caption(f"Total lines: {cached_line_count(input_file, file_mtime(input_file))}")
 
         st.subheader("🚀 Execution")
-        if st.button("Run Solution"):
-            with st.spinner("Processing..."):
-                try:
-                    p1 = module.solve_part1(input_text)
-                    st.success(f"**Part 1 Result:** {p1}")
-                except Exception as e:
-                    st.error(f"Part 1 Error: {e}")
-                
-                try:
-                    if hasattr(module, 'solve_part2'):
-                        p2 = module.solve_part2(input_text)
-                        st.info(f"**Part 2 Result:** {p2}")
-                except Exception as e:
-                    st.error(f"Part 2 Error: {e}")
+        backend = st.selectbox("Backend", runner.backend_names(module) + [runner.AUTO_BACKEND])
+        key = result_key(selected_day, backend)
+        store = result_store()
+
+        job = st.session_state.get("job")
+        if job:
+            drain_job(job)
+        running = bool(job and job["status"] == "running" and job["key"] == key)
+
+        run_col, cancel_col = st.columns([1, 1])
+        with run_col:
+            run_clicked = st.button("Run Solution", disabled=running)
+        with cancel_col:
+            cancel_clicked = st.button("Cancel", disabled=not running)
+
+        if cancel_clicked:
+            cancel_job()
+            st.warning("Run cancelled.")
+        elif run_clicked:
+            # Repeated runs of an unchanged day / input / backend come from the store
+            st.session_state.shown_key = key
+            if key not in store:
+                start_job(selected_day, backend, runner.available_parts(module), key)
+                st.rerun()
+
+        job = st.session_state.get("job")
+        if job and job["key"] == key and job["status"] == "running":
+            # Poll the worker; clicking Cancel (or any widget) interrupts this loop
+            progress = st.progress(0.0, text="Starting...")
+            live = st.empty()
+            steps = len(job["parts"]) + 1
+            while job["status"] == "running":
+                drain_job(job)
+                done = len(job["result"].parts) + (1 if job["parsed"] else 0)
+                elapsed = time.perf_counter() - job["started"]
+                progress.progress(min(done / steps, 1.0),
+                                  text=f"Step {min(done + 1, steps)}/{steps} · {elapsed:.1f}s")
+                with live.container():
+                    for part, result in job["result"].parts.items():
+                        st.caption(f"Part {part} finished in {runner.format_ms(result.wall)}")
+                time.sleep(POLL_SECONDS)
+            progress.empty()
+            live.empty()
+            st.session_state.shown_key = key
+
+        if job and job["key"] == key and job["status"] == "failed":
+            st.error(f"Run failed: {job['error']}")
+        elif st.session_state.get("shown_key") == key and key in store:
+            just_ran = bool(job and job["key"] == key and job["status"] == "done"
+                            and not run_clicked)
+            show_day_result(store[key], cached=not just_ran)
 
     with col2:
         st.subheader("💻 Source Code")
-        with open(script_path, 'r') as f:
-            code = f.read()
+        code = cached_text(script_path, file_mtime(script_path))
         st.code(code, language='python')
 
     # AI Analysis Section (Static for now, but structures the app)
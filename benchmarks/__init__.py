@@ -0,0 +1,9 @@
+"""
+Benchmarks on synthetic inputs.
+
+generators: seeded input generators for every day, parameterized by scale.
+scaling:    runs each day from 1× to 1000× the real input size
+            (python -m benchmarks.scaling).
+"""
+
+from benchmarks.generators import GENERATORS, generate
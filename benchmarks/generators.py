@@ -0,0 +1,144 @@
+"""
+Seeded synthetic input generators, one per day.
+
+Each generator takes a `scale` (1 ≈ the size of the real ~20 KB puzzle
+input; 1000 ≈ 1000× as many bytes) and a `seed`, and returns input text in
+the exact format of dayN/dayN_input.txt. The same (scale, seed) always
+produces the same text, so timings are comparable across runs and commits.
+
+The shapes follow the real inputs: value ranges, densities and line
+lengths are taken from them, and only the amount of data grows.
+"""
+
+import math
+import random
+
+
+def _rng(day_num, scale, seed):
+    # Mix the day into the seed so days don't share a random stream
+    return random.Random(f"{seed}-{day_num}-{scale}")
+
+
+def _side(base, scale):
+    """Side length of a square grid whose area grows linearly with scale."""
+    return max(3, round(base * math.sqrt(scale)))
+
+
+def generate_day1(scale=1, seed=0):
+    """Dial rotations: one `L<n>` / `R<n>` per line, distances 1-999 skewed small."""
+    rng = _rng(1, scale, seed)
+    lines = []
+    for _ in range(round(4600 * scale)):
+        distance = min(999, int(rng.expovariate(1 / 150)) + 1)
+        lines.append(f"{rng.choice('LR')}{distance}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day2(scale=1, seed=0):
+    """
+    Product ID ranges: comma-separated `start-end` pairs.
+    Starts are spread log-uniformly over 2-10 digit numbers and each range
+    spans up to ~100k IDs, as in the real input (~33 ranges, ~1.7M IDs).
+    """
+    rng = _rng(2, scale, seed)
+    ranges = []
+    for _ in range(round(33 * scale)):
+        start = int(10 ** rng.uniform(1, 10))
+        width = rng.randint(0, 100_000)
+        ranges.append(f"{start}-{start + width}")
+    return ",".join(ranges)
+
+
+def generate_day3(scale=1, seed=0):
+    """Battery banks: 100-digit lines of digits 1-9."""
+    rng = _rng(3, scale, seed)
+    digits = "123456789"
+    lines = ["".join(rng.choices(digits, k=100)) for _ in range(round(200 * scale))]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day4(scale=1, seed=0):
+    """Paper roll grid: a square of `@` (about 64%) and `.` cells."""
+    rng = _rng(4, scale, seed)
+    side = _side(138, scale)
+    lines = ["".join("@" if rng.random() < 0.64 else "." for _ in range(side))
+             for _ in range(side)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day5(scale=1, seed=0):
+    """
+    Ingredient database: fresh ID ranges, a blank line, then available IDs.
+    IDs are ~15-digit numbers; range widths are heavily skewed (many
+    singletons, a few ranges covering trillions of IDs) so ranges overlap.
+    """
+    rng = _rng(5, scale, seed)
+    low, high = 10 ** 13, 56 * 10 ** 13
+    ranges = []
+    for _ in range(round(186 * scale)):
+        start = rng.randint(low, high)
+        width = int(rng.random() ** 3 * 8 * 10 ** 12)
+        ranges.append(f"{start}-{start + width}")
+    ids = [str(rng.randint(low, high)) for _ in range(round(1000 * scale))]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids) + "\n"
+
+
+def generate_day6(scale=1, seed=0):
+    """
+    Cephalopod worksheet: four rows of 1-4 digit numbers and an operator row.
+    Each problem is a column block as wide as its longest number, separated
+    by one space column; numbers within a block share a left or right
+    alignment and the operator sits under the block's first column.
+    """
+    rng = _rng(6, scale, seed)
+    number_rows = 4
+    rows = [[] for _ in range(number_rows + 1)]
+    for _ in range(round(1000 * scale)):
+        width = rng.choices((1, 2, 3, 4), weights=(1, 4, 4, 2))[0]
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        lengths = [rng.randint(1, width) for _ in range(number_rows)]
+        lengths[rng.randrange(number_rows)] = width
+        for row, length in zip(rows, lengths):
+            number = str(rng.randint(1, 9)) + "".join(rng.choices("123456789", k=length - 1))
+            row.append(align(number, width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def generate_day7(scale=1, seed=0):
+    """
+    Tachyon manifold: a square grid with `S` centred in the top row and
+    splitters (`^`) on every other row, on about three quarters of the cells
+    of matching parity inside the beam's cone, like the real input.
+    """
+    rng = _rng(7, scale, seed)
+    side = _side(141, scale)
+    center = side // 2
+    lines = []
+    for r in range(side):
+        row = ["."] * side
+        if r == 0:
+            row[center] = "S"
+        elif r % 2 == 0:
+            reach = r // 2
+            for c in range(max(0, center - reach), min(side, center + reach + 1)):
+                if (c - center + reach) % 2 == 1 and rng.random() < 0.75:
+                    row[c] = "^"
+        lines.append("".join(row))
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+}
+
+
+def generate(day_num, scale=1, seed=0):
+    """Synthetic input text for a day at the given scale."""
+    return GENERATORS[day_num](scale, seed)
@@ -0,0 +1,338 @@
+"""
+Benchmark history: per-day, per-part, per-backend timings over commits.
+
+Every record is one JSON line in benchmarks/history.jsonl holding the git
+commit (and whether the tree was dirty), a machine fingerprint, the
+Python/NumPy versions and the median timings of one part. Only records from
+the same machine are compared unless --any-machine is given.
+
+Usage (from the repository root):
+    python -m benchmarks.history record                    # time every day at HEAD
+    python -m benchmarks.history record --days 6 7 --backend all --repeat 5 --memory
+    python -m benchmarks.history compare HEAD~3            # HEAD~3 vs the current commit
+    python -m benchmarks.history compare a8660b7 66945fc
+    python -m benchmarks.history trend                     # sparkline per day / part
+    python -m benchmarks.history trend --day 7 --part 2    # every recorded run of one part
+
+test_solutions.py --perf --record appends the perf gate's medians here as well.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import platform
+import statistics
+import subprocess
+
+from rich.console import Console
+from rich.table import Table
+
+from runner import (DEFAULT_BACKEND, PARTS, backend_for, backend_names, check_backend,
+                    environment_tag, format_ms, load_day_module, median_timings,
+                    read_input, solve_day)
+
+HISTORY_FILE = os.path.join("benchmarks", "history.jsonl")
+DEFAULT_REPEAT = 3
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+console = Console()
+
+
+def git_output(*args):
+    """Output of a git command, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def current_commit():
+    """(commit sha, dirty) for the working tree; sha is None outside git."""
+    sha = git_output("rev-parse", "HEAD")
+    # The history file itself doesn't make a measurement dirty
+    dirty = bool(git_output("status", "--porcelain", "--untracked-files=no",
+                            "--", ".", f":!{HISTORY_FILE}"))
+    return sha, dirty
+
+
+def resolve_commit(ref):
+    """Full sha for a ref (HEAD~2, a branch, an abbreviated sha); ref itself if git can't."""
+    return git_output("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}") or ref
+
+
+def machine_fingerprint():
+    """Short stable id plus a readable description of this machine."""
+    description = (f"{platform.system()} {platform.machine()}, "
+                   f"{platform.processor() or 'unknown cpu'}, {os.cpu_count()} CPUs")
+    machine_id = hashlib.sha256(f"{platform.node()}|{description}".encode()).hexdigest()[:12]
+    return {"id": machine_id, "description": description}
+
+
+def make_records(day_result, day_num, runs, commit=None, dirty=False, machine=None):
+    """History records (one per part) for a DayResult of median timings."""
+    if machine is None:
+        machine = machine_fingerprint()
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    records = []
+    for part, result in day_result.parts.items():
+        if result.error:
+            continue
+        records.append({
+            "timestamp": stamp,
+            "commit": commit,
+            "dirty": dirty,
+            "machine": machine,
+            "environment": environment_tag(),
+            "day": day_num,
+            "part": part,
+            "backend": day_result.backend,
+            "runs": runs,
+            "parse": day_result.parse_wall,
+            "wall": result.wall,
+            "cpu": result.cpu,
+            "peak_memory": result.peak_memory,
+        })
+    return records
+
+
+def append_records(records, path=HISTORY_FILE):
+    """Append records as JSON lines."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def load_records(path=HISTORY_FILE, machine_id=None):
+    """All records, oldest first; only this machine_id's when given."""
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    if machine_id is not None:
+        records = [r for r in records if r["machine"]["id"] == machine_id]
+    return records
+
+
+def record_days(days, backend=DEFAULT_BACKEND, repeat=DEFAULT_REPEAT, path=HISTORY_FILE,
+                memory=False):
+    """
+    Time days on their real inputs (median of `repeat`) and append to the history.
+    With memory=True one extra tracemalloc run per day records each part's peak memory
+    (kept out of the timed runs, since tracing slows them down).
+    """
+    commit, dirty = current_commit()
+    machine = machine_fingerprint()
+    written = []
+    for day_num in days:
+        module = load_day_module(day_num)
+        input_text = read_input(day_num)
+        if module is None or input_text is None:
+            continue
+        names = backend_names(module) if backend == "all" else [backend_for(module, backend)]
+        for name in names:
+            with console.status(f"[cyan]Timing day {day_num} ({name})..."):
+                day_result = median_timings(module, input_text, repeat, backend=name)
+                if memory:
+                    traced = solve_day(module, input_text, backend=name, profile=True)
+                    for part, result in day_result.parts.items():
+                        result.peak_memory = traced.parts[part].peak_memory
+            written.extend(make_records(day_result, day_num, repeat, commit, dirty, machine))
+    append_records(written, path)
+    return written
+
+
+def medians_by_key(records):
+    """Median wall time per (day, part, backend)."""
+    grouped = {}
+    for r in records:
+        grouped.setdefault((r["day"], r["part"], r["backend"]), []).append(r["wall"])
+    return {key: statistics.median(walls) for key, walls in grouped.items()}
+
+
+def records_for_commit(records, ref):
+    """Records whose commit matches ref (resolved through git, or as a sha prefix)."""
+    sha = resolve_commit(ref)
+    return [r for r in records if r["commit"] and
+            (r["commit"] == sha or r["commit"].startswith(ref))]
+
+
+def compare(old_ref, new_ref="HEAD", path=HISTORY_FILE, any_machine=False):
+    """Print per day / part / backend speedups between two recorded commits."""
+    machine_id = None if any_machine else machine_fingerprint()["id"]
+    records = load_records(path, machine_id)
+    old = medians_by_key(records_for_commit(records, old_ref))
+    new = medians_by_key(records_for_commit(records, new_ref))
+
+    if not old or not new:
+        missing = old_ref if not old else new_ref
+        console.print(f"[red]No records for {missing} on this machine[/red] "
+                      "[dim](record one with `python -m benchmarks.history record`, "
+                      "or pass --any-machine)[/dim]")
+        return False
+
+    table = Table(title=f"{old_ref} → {new_ref}")
+    table.add_column("Day", justify="right", style="cyan")
+    table.add_column("Part", justify="right")
+    table.add_column("Backend", style="green")
+    table.add_column(old_ref, justify="right", style="dim")
+    table.add_column(new_ref, justify="right")
+    table.add_column("Change", justify="right")
+
+    for key in sorted(set(old) & set(new)):
+        before, after = old[key], new[key]
+        speedup = before / after if after else float("inf")
+        if speedup >= 1.1:
+            change = f"[green]{speedup:.2f}× faster[/green]"
+        elif speedup <= 1 / 1.1:
+            change = f"[red]{1 / speedup:.2f}× slower[/red]"
+        else:
+            change = "[dim]≈ same[/dim]"
+        day, part, backend = key
+        table.add_row(str(day), str(part), backend, format_ms(before), format_ms(after), change)
+
+    console.print(table)
+    only = sorted(set(old) ^ set(new))
+    if only:
+        console.print(f"[dim]{len(only)} day/part/backend entries were recorded "
+                      "at only one of the two commits[/dim]")
+    return True
+
+
+def sparkline(values):
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    return "".join(SPARK_CHARS[int((v - low) / span * (len(SPARK_CHARS) - 1))] for v in values)
+
+
+def commit_series(records):
+    """
+    Median wall time per commit, in recording order: [(label, median_wall)]
+    where label is the short sha, suffixed with + for a dirty tree.
+    """
+    series = []
+    for r in records:
+        label = (r["commit"] or "unknown")[:7] + ("+" if r["dirty"] else "")
+        if series and series[-1][0] == label:
+            series[-1][1].append(r["wall"])
+        else:
+            series.append((label, [r["wall"]]))
+    return [(label, statistics.median(walls)) for label, walls in series]
+
+
+def trend(day=None, part=None, backend=DEFAULT_BACKEND, last=20, path=HISTORY_FILE,
+          any_machine=False):
+    """
+    Without day: one sparkline of the last `last` commits per day and part.
+    With day (and optionally part): every recorded commit for it, with the change.
+    """
+    machine_id = None if any_machine else machine_fingerprint()["id"]
+    records = [r for r in load_records(path, machine_id) if r["backend"] == backend]
+    if day is not None:
+        records = [r for r in records if r["day"] == day]
+    if part is not None:
+        records = [r for r in records if r["part"] == part]
+    if not records:
+        console.print("[yellow]No matching history recorded yet[/yellow]")
+        return
+
+    keys = sorted({(r["day"], r["part"]) for r in records})
+
+    if day is None:
+        table = Table(title=f"Timing trend ({backend}, last {last} commits)")
+        table.add_column("Day", justify="right", style="cyan")
+        table.add_column("Part", justify="right")
+        table.add_column("Trend", style="green")
+        table.add_column("First", justify="right", style="dim")
+        table.add_column("Latest", justify="right")
+        table.add_column("Change", justify="right")
+        for d, p in keys:
+            series = commit_series([r for r in records if (r["day"], r["part"]) == (d, p)])[-last:]
+            walls = [wall for _, wall in series]
+            table.add_row(str(d), str(p), sparkline(walls), format_ms(walls[0]),
+                          format_ms(walls[-1]), f"{walls[0] / walls[-1]:.2f}×")
+        console.print(table)
+        console.print("[dim]Change > 1× means the latest commit is faster than the first shown[/dim]")
+        return
+
+    for d, p in keys:
+        series = commit_series([r for r in records if (r["day"], r["part"]) == (d, p)])[-last:]
+        table = Table(title=f"Day {d} Part {p} ({backend})")
+        table.add_column("Commit", style="cyan")
+        table.add_column("Median", justify="right")
+        table.add_column("vs previous", justify="right")
+        table.add_column("", style="green")
+        peak = max(wall for _, wall in series)
+        previous = None
+        for label, wall in series:
+            delta = "" if previous is None else f"{(wall - previous) / previous * 100:+.0f}%"
+            bar = "█" * max(1, round(wall / peak * 30))
+            table.add_row(label, format_ms(wall), delta, bar)
+            previous = wall
+        console.print(table)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark history across commits")
+    parser.add_argument("--store", default=HISTORY_FILE,
+                        help=f"History file (default: {HISTORY_FILE})")
+    parser.add_argument("--any-machine", action="store_true",
+                        help="Include records from other machines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Time days at the current commit")
+    record.add_argument("--days", type=int, nargs="+", default=None,
+                        help="Days to time (default: every day with an input)")
+    record.add_argument("--backend", default=DEFAULT_BACKEND,
+                        help='Backend name, "auto", or "all" for every backend')
+    record.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per part; the median is stored (default: {DEFAULT_REPEAT})")
+    record.add_argument("--memory", action="store_true",
+                        help="Also record each part's tracemalloc peak memory (one extra run)")
+
+    comp = commands.add_parser("compare", help="Speedups between two recorded commits")
+    comp.add_argument("old", help="Baseline commit (sha, branch, HEAD~N)")
+    comp.add_argument("new", nargs="?", default="HEAD", help="Commit to compare (default: HEAD)")
+
+    trend_cmd = commands.add_parser("trend", help="Timings over the recorded commits")
+    trend_cmd.add_argument("--day", type=int, default=None)
+    trend_cmd.add_argument("--part", type=int, choices=PARTS, default=None)
+    trend_cmd.add_argument("--backend", default=DEFAULT_BACKEND)
+    trend_cmd.add_argument("--last", type=int, default=20, help="Number of commits to show")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.command == "record":
+        days = args.days
+        if days is None:
+            days = sorted(int(name[3:]) for name in os.listdir(".")
+                          if name.startswith("day") and name[3:].isdigit())
+        try:
+            check_backend(args.backend, [m for m in map(load_day_module, days) if m],
+                          extra=("all",))
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(2)
+        written = record_days(days, args.backend, args.repeat, args.store, args.memory)
+        commit, dirty = current_commit()
+        label = (commit or "unknown")[:7] + (" (dirty)" if dirty else "")
+        console.print(f"[green]Recorded {len(written)} timings at {label} in {args.store}[/green]")
+    elif args.command == "compare":
+        if not compare(args.old, args.new, args.store, args.any_machine):
+            sys.exit(1)
+    else:
+        trend(args.day, args.part, args.backend, args.last, args.store, args.any_machine)
+
+
+if __name__ == "__main__":
+    main()
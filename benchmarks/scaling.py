@@ -0,0 +1,235 @@
+"""
+Scaling benchmark: run each day on synthetic inputs from 1× to 1000× the
+real input size, fit the empirical complexity and report throughput.
+
+Usage (from the repository root):
+    python -m benchmarks.scaling                      # all days, scales 1 10 100 1000
+    python -m benchmarks.scaling --days 2 7 --scales 1 4 16 64
+    python -m benchmarks.scaling --backend auto --repeat 3 --json scaling.json
+
+A scale is skipped once the points measured so far predict that a part
+would exceed --max-seconds (extrapolating with their fitted exponent, or
+linearly from a single point), so blow-ups like day2's range
+materialization or day5's O(ranges × ids) scan stop early instead of
+running for hours.
+"""
+
+import sys
+import json
+import math
+import argparse
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from runner import (DEFAULT_BACKEND, PARTS, backend_for, check_backend, format_ms,
+                    load_day_module, median_timings)
+from benchmarks.generators import GENERATORS, generate
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+DEFAULT_MAX_SECONDS = 30.0
+# Timings below this are dominated by overhead and left out of the fit
+FIT_MIN_SECONDS = 0.001
+
+console = Console()
+
+
+def run_point(module, day_num, scale, seed=0, repeat=1, backend=DEFAULT_BACKEND):
+    """
+    Time one day at one scale.
+    Returns a dict with the input size, the backend used, the median parse
+    time and, per part, the median wall time (or the error).
+    """
+    text = generate(day_num, scale, seed)
+    day_result = median_timings(module, text, repeat, backend=backend)
+    return {
+        "day": day_num,
+        "scale": scale,
+        "bytes": len(text),
+        "backend": day_result.backend,
+        "parse": day_result.parse_wall,
+        "parts": {part: result.wall for part, result in day_result.parts.items()
+                  if not result.error},
+        "errors": {part: result.error for part, result in day_result.parts.items()
+                   if result.error},
+    }
+
+
+def fit_exponent(sizes, seconds):
+    """
+    Least-squares slope of log(time) against log(size): time ~ size ** k.
+    Returns None when fewer than two usable points remain.
+    """
+    points = [(s, t) for s, t in zip(sizes, seconds) if t >= FIT_MIN_SECONDS]
+    if len(points) < 2:
+        return None
+    x = np.log([s for s, _ in points])
+    y = np.log([t for _, t in points])
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def describe_exponent(k):
+    """Nearest textbook complexity class for a fitted exponent."""
+    if k is None:
+        return "n/a (needs 2+ points)"
+    if k < 0.3:
+        return "~O(1)"
+    if k < 1.15:
+        return "~O(n)"
+    if k < 1.35:
+        return "~O(n log n)"
+    if k < 1.75:
+        return "~O(n^1.5)"
+    if k < 2.5:
+        return "~O(n²)"
+    return "super-quadratic"
+
+
+def predict_seconds(measured, scale):
+    """
+    Predicted parse + slowest part time at `scale`. Each is extrapolated
+    from the last measured point with the exponent fitted to all measured
+    points so far, or linearly while fewer than two are usable, so
+    super-linear days are not underestimated.
+    """
+    sizes = [point["scale"] for point in measured]
+    growth = scale / sizes[-1]
+
+    def extrapolate(seconds):
+        exponent = fit_exponent(sizes, seconds)
+        return seconds[-1] * growth ** (1.0 if exponent is None else exponent)
+
+    last = measured[-1]
+    slowest = max((extrapolate([point["parts"][part] for point in measured])
+                   for part in last["parts"]
+                   if all(part in point["parts"] for point in measured)), default=0.0)
+    return slowest + extrapolate([point["parse"] for point in measured])
+
+
+def scale_day(day_num, scales=DEFAULT_SCALES, seed=0, repeat=1,
+              backend=DEFAULT_BACKEND, max_seconds=DEFAULT_MAX_SECONDS):
+    """Run one day at every scale (within the time budget). Returns the points."""
+    module = load_day_module(day_num)
+    backend = backend_for(module, backend)
+    points = []
+    measured = []
+    for scale in sorted(scales):
+        if measured and (measured[-1]["errors"] or predict_seconds(measured, scale) > max_seconds):
+            points.append({"day": day_num, "scale": scale, "skipped": True})
+            continue
+        measured.append(run_point(module, day_num, scale, seed, repeat, backend))
+        points.append(measured[-1])
+    return points
+
+
+def summarize(points):
+    """Per-part exponent and throughput (MB/s at the largest scale run)."""
+    measured = [p for p in points if not p.get("skipped")]
+    summary = {}
+    for part in PARTS:
+        usable = [p for p in measured if part in p["parts"]]
+        if not usable:
+            continue
+        exponent = fit_exponent([p["bytes"] for p in usable],
+                                [p["parts"][part] for p in usable])
+        largest = usable[-1]
+        elapsed = largest["parse"] + largest["parts"][part]
+        summary[part] = {
+            "exponent": exponent,
+            "complexity": describe_exponent(exponent),
+            "throughput_mb_s": largest["bytes"] / elapsed / 1e6 if elapsed else math.inf,
+        }
+    return summary
+
+
+def format_size(size):
+    return f"{size / 1e6:.1f} MB" if size >= 1e6 else f"{size / 1e3:.1f} KB"
+
+
+def format_throughput(mb_per_second):
+    if mb_per_second >= 1:
+        return f"{mb_per_second:.2f} MB/s"
+    return f"{mb_per_second * 1e3:.2f} KB/s"
+
+
+def print_day(day_num, points, summary):
+    table = Table(title=f"Day {day_num} scaling")
+    table.add_column("Scale", justify="right", style="cyan")
+    table.add_column("Input", justify="right")
+    table.add_column("Parse", justify="right", style="dim")
+    for part in PARTS:
+        table.add_column(f"Part {part}", justify="right")
+
+    for point in points:
+        if point.get("skipped"):
+            table.add_row(f"{point['scale']}×", "-", "-",
+                          *["[dim]skipped (over budget)[/dim]"] * len(PARTS))
+            continue
+        cells = []
+        for part in PARTS:
+            if part in point["parts"]:
+                cells.append(format_ms(point["parts"][part]))
+            else:
+                cells.append(f"[red]{point['errors'].get(part, '-')}[/red]")
+        table.add_row(f"{point['scale']}×", format_size(point["bytes"]),
+                      format_ms(point["parse"]), *cells)
+
+    fit_cells = []
+    for part in PARTS:
+        info = summary.get(part)
+        if info is None:
+            fit_cells.append("-")
+            continue
+        exponent = "" if info["exponent"] is None else f"n^{info['exponent']:.2f} "
+        fit_cells.append(f"{exponent}{info['complexity']}\n"
+                         f"{format_throughput(info['throughput_mb_s'])}")
+    table.add_section()
+    table.add_row("[bold]fit[/bold]", "", "", *fit_cells)
+    console.print(table)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scaling benchmark on synthetic inputs")
+    parser.add_argument("--days", type=int, nargs="+", default=sorted(GENERATORS),
+                        help="Days to benchmark (default: all)")
+    parser.add_argument("--scales", type=float, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Input size multipliers (default: 1 10 100 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Runs per point; the median is reported")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND,
+                        help='Backend name from the day\'s BACKENDS, or "auto"')
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="Skip scales predicted to take longer than this per part")
+    parser.add_argument("--json", metavar="PATH", default=None,
+                        help="Also write all points and fits to a JSON file")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scales = [int(s) if float(s).is_integer() else s for s in args.scales]
+    try:
+        check_backend(args.backend, [load_day_module(day_num) for day_num in args.days])
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(2)
+
+    results = {}
+    for day_num in args.days:
+        with console.status(f"[cyan]Benchmarking day {day_num}..."):
+            points = scale_day(day_num, scales, args.seed, args.repeat,
+                               args.backend, args.max_seconds)
+        summary = summarize(points)
+        print_day(day_num, points, summary)
+        results[day_num] = {"points": points, "summary": summary}
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        console.print(f"[dim]Results written to {args.json}[/dim]")
+
+
+if __name__ == "__main__":
+    main()
@@ -86,12 +86,18 @@ def process_ids_part2(ids):
     return result
 
 # Standard aliases for the runner
-def solve_part1(input_text):
-    all_ids = parse_ranges(input_text)
+def parse(input_text):
+    """Runner hook: parse once, shared by both parts."""
+    return parse_ranges(input_text)
+
+def solve_part1(data):
+    """data is the raw input text or the result of parse()."""
+    all_ids = parse(data) if isinstance(data, str) else data
     return process_ids(all_ids)
 
-def solve_part2(input_text):
-    all_ids = parse_ranges(input_text)
+def solve_part2(data):
+    """data is the raw input text or the result of parse()."""
+    all_ids = parse(data) if isinstance(data, str) else data
     return process_ids_part2(all_ids)
 
 
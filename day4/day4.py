@@ -76,15 +76,20 @@ def remove_rolls_iteratively(grid):
     return total_removed
 
 
-def solve_part1(input_text):
-    """Parse input and count accessible rolls."""
-    lines = [list(line.strip()) for line in input_text.strip().split('\n') if line.strip()]
+def parse(input_text):
+    """Parse the grid once; the runner shares it between both parts."""
+    return [list(line.strip()) for line in input_text.strip().split('\n') if line.strip()]
+
+
+def solve_part1(data):
+    """Count accessible rolls. data is the raw input text or the result of parse()."""
+    lines = parse(data) if isinstance(data, str) else data
     return count_accessible_rolls(lines)
 
 
-def solve_part2(input_text):
-    """Parse input and count total removable rolls."""
-    lines = [list(line.strip()) for line in input_text.strip().split('\n') if line.strip()]
+def solve_part2(data):
+    """Count total removable rolls. data is the raw input text or the result of parse()."""
+    lines = parse(data) if isinstance(data, str) else data
     return remove_rolls_iteratively(lines)
 
 
@@ -1,72 +1,208 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+
 import numpy as np
 
 
-def parse_worksheet(text):
+SPACE = ord(' ')
+NEWLINE = ord('\n')
+ZERO = ord('0')
+NINE = ord('9')
+
+# Any number with at most 18 digits fits in int64
+MAX_INT64_DIGITS = 18
+POWERS_OF_TEN = 10 ** np.arange(MAX_INT64_DIGITS + 1, dtype=np.int64)
+
+# Columns batch-evaluated at a time (whole problems, so bands may run longer)
+BAND_COLS = 1 << 16
+
+
+# Bytes inspected per step when trimming blank lines from either end
+TRIM_CHUNK = 4096
+# Bytes compared at a time when locating newlines (bounds the temporary mask)
+SCAN_CHUNK = 1 << 20
+
+
+def content_bounds(buf):
     """
-    Parse the worksheet into individual problems using numpy.
-    Problems are arranged vertically and separated by columns of spaces.
+    [first, end) of the bytes left after trimming newlines from both ends
+    (same as bytes.strip(b'\n')), or (0, 0) if there are none.
+    Scans inward from each end a chunk at a time, so only the blank lines
+    themselves are inspected.
     """
-    lines = text.strip('\n').split('\n')
-    
-    if not lines:
-        return []
+    n = len(buf)
+    first = 0
+    while first < n:
+        block = buf[first:first + TRIM_CHUNK]
+        hits = np.flatnonzero(block != NEWLINE)
+        if hits.size:
+            first += int(hits[0])
+            break
+        first += len(block)
+    else:
+        return 0, 0
     
-    # Pad all lines to the same length
-    max_len = max(len(line) for line in lines)
-    lines = [line.ljust(max_len) for line in lines]
+    end = n
+    while True:
+        low = max(first, end - TRIM_CHUNK)
+        hits = np.flatnonzero(buf[low:end] != NEWLINE)
+        if hits.size:
+            return first, low + int(hits[-1]) + 1
+        end = low
+
+
+def newline_positions(buf):
+    """Indices of every newline in buf, found one SCAN_CHUNK at a time."""
+    found = [np.flatnonzero(buf[i:i + SCAN_CHUNK] == NEWLINE) + i
+             for i in range(0, len(buf), SCAN_CHUNK)]
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def grid_from_buffer(buf):
+    """
+    Turn a flat uint8 buffer of worksheet bytes into a 2D uint8 grid.
     
-    # Convert to numpy array of characters
-    grid = np.array([list(line) for line in lines])
+    When every row has the same length the grid is a strided view of the
+    buffer (newline bytes are simply stepped over); only the newline
+    positions are indexed. Otherwise rows are copied into a preallocated
+    space-filled matrix.
+    """
+    # Trim leading/trailing blank lines (same as text.strip('\n'))
+    first, end = content_bounds(buf)
+    if first == end:
+        return np.empty((0, 0), dtype=np.uint8)
+    buf = buf[first:end]
     
-    # Transpose to work with columns (each column is a vertical slice)
-    grid_T = grid.T
+    breaks = newline_positions(buf)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(buf)]))
+    lengths = ends - starts
+    rows = len(starts)
+    width = int(lengths.max())
     
-    # Split by empty columns (all spaces)
-    problems = []
-    current_problem = []
+    if (lengths == width).all():
+        # Row i starts at i * (width + 1): view it without copying
+        return np.lib.stride_tricks.as_strided(
+            buf, shape=(rows, width), strides=(width + 1, 1), writeable=False
+        )
     
-    for col in grid_T:
-        col_str = ''.join(col)
-        if col_str.strip() == '':  # Empty column - separator
-            if current_problem:
-                problems.append(current_problem)
-                current_problem = []
-        else:
-            current_problem.append(col_str)
+    # Ragged rows: pad on the right with spaces
+    grid = np.full((rows, width), SPACE, dtype=np.uint8)
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        grid[i, :end - start] = buf[start:end]
     
-    # Don't forget the last problem
-    if current_problem:
-        problems.append(current_problem)
+    return grid
+
+
+def worksheet_grid(text):
+    """
+    Convert the worksheet text into a 2D uint8 grid (one byte per character).
+    Short lines are padded with spaces on the right.
+    """
+    return grid_from_buffer(np.frombuffer(text.encode(), dtype=np.uint8))
+
+
+def load_worksheet(path):
+    """
+    Load a worksheet file as a 2D uint8 grid.
+    The file is memory-mapped, so equal-length rows are never copied.
+    """
+    if os.path.getsize(path) == 0:
+        return np.empty((0, 0), dtype=np.uint8)
     
-    return problems
+    return grid_from_buffer(np.memmap(path, dtype=np.uint8, mode='r'))
 
 
-def solve_problem(problem_columns):
+def find_problem_bounds(grid):
     """
-    Part 1: Solve a single problem given its columns.
-    Each column contains numbers stacked vertically with an operator at the bottom.
-    Numbers are in rows, read left-to-right.
+    Find the [start, end) column bounds of every problem in the grid.
+    Problems are separated by columns that are entirely spaces.
     """
-    if not problem_columns:
-        return 0
+    # True for separator columns; pad both sides so every problem
+    # has a separator -> content and content -> separator transition
+    is_sep = (grid == SPACE).all(axis=0)
+    padded = np.concatenate(([True], is_sep, [True])).astype(np.int8)
+    
+    # -1 marks the first column of a problem, +1 the column after its last
+    edges = np.flatnonzero(np.diff(padded))
+    bounds = edges.reshape(-1, 2)
     
-    # Extract numbers and operator from the problem columns
+    return bounds[:, 0], bounds[:, 1]
+
+
+def split_problems(grid):
+    """
+    Split a worksheet grid into problem blocks.
+    Each block is a (rows x width) uint8 view into the grid, so no
+    characters are copied.
+    """
+    starts, ends = find_problem_bounds(grid)
+    return [grid[:, start:end] for start, end in zip(starts, ends)]
+
+
+def parse_worksheet(text):
+    """
+    Parse the worksheet into individual problems using numpy.
+    Problems are arranged vertically and separated by columns of spaces.
+    """
+    return split_problems(worksheet_grid(text))
+
+
+def read_problem(block):
+    """
+    Part 1 reading of a problem block.
+    Returns (numbers, operator) with numbers read from the rows left-to-right.
+    """
     numbers = []
-    operator = None
     
-    # Join columns back into rows for this problem
-    num_rows = len(problem_columns[0])
-    rows = []
-    for row_idx in range(num_rows):
-        row = ''.join(col[row_idx] for col in problem_columns)
-        rows.append(row.strip())
+    rows = [row.tobytes().decode().strip() for row in block]
     
     # Last row is the operator, previous rows are numbers
     for row in rows[:-1]:
         if row:  # Skip empty rows
             numbers.append(int(row))
     
-    operator = rows[-1].strip()
+    operator = rows[-1]
+    
+    return numbers, operator
+
+
+def read_problem_part2(block):
+    """
+    Part 2 reading of a problem block.
+    Returns (numbers, operator) with one number per column, right-to-left.
+    """
+    numbers = []
+    operator = None
+    
+    # The operator is in the last row (same across all columns)
+    op_row = block[-1].tobytes().decode().strip()
+    if op_row and op_row[0] in ['*', '+', '%']:
+        operator = op_row[0]
+    
+    # Read columns RIGHT-TO-LEFT to get numbers
+    for col in block[:-1, ::-1].T:
+        # Digits top to bottom = most to least significant
+        digits = col.tobytes().decode().strip()
+        if digits:
+            numbers.append(int(digits.replace(' ', '')))
+    
+    return numbers, operator
+
+
+def solve_problem(block):
+    """
+    Part 1: Solve a single problem given its block of the grid.
+    Each column contains numbers stacked vertically with an operator at the bottom.
+    Numbers are in rows, read left-to-right.
+    """
+    if block.size == 0:
+        return 0
+    
+    numbers, operator = read_problem(block)
     
     # Calculate result
     if not numbers:
@@ -82,42 +218,17 @@ def solve_problem(problem_columns):
     return result
 
 
-def solve_problem_part2(problem_columns):
+def solve_problem_part2(block):
     """
     Part 2: Solve reading right-to-left in columns (Cephalopod math).
     Each COLUMN represents one number (digits top-to-bottom).
     Process columns right-to-left.
     Operators include *, +, and % (modulo).
     """
-    if not problem_columns:
+    if block.size == 0:
         return 0
     
-    numbers = []
-    operator = None
-    
-    # The operator is in the last row (same across all columns)
-    # Get it from any column that has it
-    for col in problem_columns:
-        op_char = col[-1].strip()
-        if op_char and op_char in ['*', '+', '%']:
-            operator = op_char
-            break
-    
-    # Read columns RIGHT-TO-LEFT to get numbers
-    for col_idx in range(len(problem_columns) - 1, -1, -1):
-        col = problem_columns[col_idx]
-        
-        # Extract digits (all rows except last which is operator row)
-        digits = []
-        for row_idx in range(len(col) - 1):
-            char = col[row_idx]
-            if char.strip():  # Not a space
-                digits.append(char)
-        
-        if digits:
-            # Form number from digits (top to bottom = most to least significant)
-            number = int(''.join(digits))
-            numbers.append(number)
+    numbers, operator = read_problem_part2(block)
     
     # Calculate result
     if not numbers:
@@ -135,41 +246,509 @@ def solve_problem_part2(problem_columns):
     return result
 
 
-def solve_worksheet(text):
+def solve_grid(grid):
     """
-    Part 1: Solve all problems on the worksheet and return the grand total.
+    Part 1: Solve all problems in a worksheet grid and return the grand total.
     """
-    problems = parse_worksheet(text)
     total = 0
     
-    for problem in problems:
+    for problem in split_problems(grid):
         answer = solve_problem(problem)
         total += answer
     
     return total
 
 
-def solve_worksheet_part2(text):
+def solve_grid_part2(grid):
     """
-    Part 2: Solve all problems reading right-to-left (Cephalopod math).
+    Part 2: Solve all problems in a worksheet grid reading right-to-left.
     """
-    problems = parse_worksheet(text)
     total = 0
     
-    for problem in problems:
+    for problem in split_problems(grid):
         answer = solve_problem_part2(problem)
         total += answer
     
     return total
 
-# Standard aliases for the runner
-solve_part1 = solve_worksheet
-solve_part2 = solve_worksheet_part2
+
+def solve_worksheet(text):
+    """
+    Part 1: Solve all problems on the worksheet and return the grand total.
+    """
+    return solve_grid(worksheet_grid(text))
+
+
+def solve_worksheet_part2(text):
+    """
+    Part 2: Solve all problems reading right-to-left (Cephalopod math).
+    """
+    return solve_grid_part2(worksheet_grid(text))
+
+def problem_operators(grid, starts, ends):
+    """
+    Operator byte of each problem: the first non-space character of the
+    bottom row inside the problem's columns (SPACE if there is none).
+    """
+    op_row = grid[-1]
+    op_cols = np.flatnonzero(op_row != SPACE)
+    
+    pos = np.searchsorted(op_cols, starts)
+    found = pos < len(op_cols)
+    first = op_cols[np.minimum(pos, len(op_cols) - 1)] if len(op_cols) else starts
+    found &= first < ends
+    
+    return np.where(found, op_row[first], SPACE)
+
+
+def digit_arrays(grid):
+    """
+    Split the number rows (all but the operator row) into a uint8 digit
+    array and a boolean mask of which cells hold digits.
+    """
+    numbers = grid[:-1]
+    is_digit = (numbers >= ZERO) & (numbers <= NINE)
+    digits = (numbers - np.uint8(ZERO)) * is_digit
+    return digits, is_digit
+
+
+def column_problems(cols, starts):
+    """
+    Problem index of every column as int32; separator columns belong to
+    the problem on their left (columns before the first one to problem 0).
+    """
+    spans = np.diff(np.append(starts, cols))
+    spans[0] += starts[0]
+    return np.repeat(np.arange(len(starts), dtype=np.int32), spans)
+
+
+def row_numbers(digits, is_digit, starts, ends):
+    """
+    Part 1 reading: numbers[r, p] is the number on row r of problem p.
+    Returns (numbers, digit_counts), both shaped (rows - 1, problems);
+    a count of 0 means the row is empty for that problem.
+    
+    Rows are reduced one at a time, so the only grid-sized temporaries
+    are a row's worth of int32 / int8 / int64 columns.
+    """
+    rows, cols = digits.shape
+    col_end = ends.astype(np.int32)[column_problems(cols, starts)]
+    
+    numbers = np.empty((rows, len(starts)), dtype=np.int64)
+    counts = np.empty((rows, len(starts)), dtype=np.int32)
+    suffix = np.zeros(cols + 1, dtype=np.int32)
+    for r in range(rows):
+        # suffix[c] = digits at columns >= c on this row (extra zero at the end)
+        suffix[:cols] = np.cumsum(is_digit[r, ::-1], dtype=np.int32)[::-1]
+        
+        # Place value of each digit = digits to its right within the same problem
+        exponent = np.clip(suffix[:cols] - suffix[col_end] - 1, 0, MAX_INT64_DIGITS).astype(np.int8)
+        values = POWERS_OF_TEN[exponent]
+        values *= digits[r]
+        
+        numbers[r] = np.add.reduceat(values, starts)
+        counts[r] = suffix[starts] - suffix[ends]
+    return numbers, counts
+
+
+def column_numbers(digits, is_digit, starts, ends):
+    """
+    Part 2 reading: numbers[k, p] is the number in the k-th column of problem
+    p counted from the RIGHT (digits top-to-bottom).
+    Returns (numbers, digit_counts), shaped (max problem width, problems).
+    """
+    rows, cols = digits.shape
+    
+    # Horner top to bottom, skipping blanks: one int64 accumulator per column
+    col_values = np.zeros(cols, dtype=np.int64)
+    for r in range(rows):
+        stepped = col_values * 10
+        stepped += digits[r]
+        np.copyto(col_values, stepped, where=is_digit[r])
+    col_counts = is_digit.sum(axis=0, dtype=np.int32)
+    
+    # Scatter each column into its (offset from right, problem) slot
+    width = int((ends - starts).max())
+    numbers = np.zeros((width, len(starts)), dtype=np.int64)
+    counts = np.zeros((width, len(starts)), dtype=np.int32)
+    
+    col_problem = column_problems(cols, starts)
+    col_index = np.arange(cols, dtype=np.int32)
+    offset = ends.astype(np.int32)[col_problem] - 1 - col_index
+    inside = (offset >= 0) & (col_index >= starts[0])
+    slots = (offset[inside], col_problem[inside])
+    numbers[slots] = col_values[inside]
+    counts[slots] = col_counts[inside]
+    
+    return numbers, counts
+
+
+def fold_numbers(numbers, counts, operators, allow_modulo):
+    """
+    Evaluate every problem at once, grouped by operator.
+    
+    numbers/counts are (k, problems) arrays in reading order; slots with a
+    digit count of 0 are empty and skipped. '+' and '*' use array
+    reductions, '%' folds across k with all problems in lock step, and any
+    other operator yields the first number (same as the per-problem solvers).
+    
+    Returns (results, safe): results is int64, and safe is False for problems
+    whose result could overflow int64 (or that divide by zero); those must be
+    re-solved with Python ints.
+    """
+    # No number rows (a lone operator line): every problem is empty and scores 0
+    if numbers.shape[0] == 0:
+        problems = numbers.shape[1]
+        return np.zeros(problems, dtype=np.int64), np.ones(problems, dtype=bool)
+    
+    valid = counts > 0
+    present = valid.sum(axis=0)
+    max_digits = counts.max(axis=0)
+    
+    # First non-empty number of each problem
+    first_idx = np.argmax(valid, axis=0)
+    first = numbers[first_idx, np.arange(numbers.shape[1])]
+    
+    results = np.where(present > 0, first, 0)
+    safe = max_digits <= MAX_INT64_DIGITS
+    
+    is_add = operators == ord('+')
+    if is_add.any():
+        sums = np.where(valid[:, is_add], numbers[:, is_add], 0).sum(axis=0)
+        results[is_add] = sums
+        # n numbers below 10**d sum to less than n * 10**d
+        bound = np.log10(np.maximum(present[is_add], 1)) + max_digits[is_add]
+        safe[is_add] &= bound <= MAX_INT64_DIGITS
+    
+    is_mul = operators == ord('*')
+    if is_mul.any():
+        products = np.where(valid[:, is_mul], numbers[:, is_mul], 1).prod(axis=0)
+        results[is_mul] = np.where(present[is_mul] > 0, products, 0)
+        # Product of numbers with d1..dn digits is below 10**(d1 + ... + dn)
+        safe[is_mul] &= counts[:, is_mul].sum(axis=0) <= MAX_INT64_DIGITS
+    
+    is_mod = (operators == ord('%')) if allow_modulo else np.zeros_like(is_add)
+    if is_mod.any():
+        acc = results[is_mod]
+        mod_safe = safe[is_mod]
+        seen_first = np.zeros(len(acc), dtype=bool)
+        for k in range(len(numbers)):
+            here = valid[k, is_mod]
+            divisor = numbers[k, is_mod]
+            apply = here & seen_first
+            # Division by zero must raise, so leave it to Python
+            mod_safe &= ~(apply & (divisor == 0))
+            acc = np.where(apply, acc % np.where(divisor == 0, 1, divisor), acc)
+            seen_first |= here
+        results[is_mod] = acc
+        safe[is_mod] = mod_safe
+    
+    return results, safe
+
+
+def total_with_fallback(grid, starts, ends, numbers, counts, operators,
+                        solve_one, allow_modulo):
+    """
+    Fold all problems by operator, add up the int64-safe results and
+    re-solve the unsafe ones with solve_one (Python ints).
+    """
+    results, safe = fold_numbers(numbers, counts, operators, allow_modulo)
+    
+    total = sum(results[safe].tolist())
+    
+    # Arbitrary-precision fallback for results that may not fit in int64
+    for p in np.flatnonzero(~safe):
+        total += solve_one(grid[:, starts[p]:ends[p]])
+    
+    return total
+
+
+def problem_bands(grid, starts, ends, band_cols=BAND_COLS):
+    """
+    Yield (band, band_starts, band_ends): consecutive runs of whole problems
+    spanning about band_cols columns, with bounds relative to the band.
+    Batch evaluation works band by band so its temporaries stay bounded.
+    """
+    first = 0
+    while first < len(starts):
+        last = max(int(np.searchsorted(starts, starts[first] + band_cols)), first + 1)
+        left = starts[first]
+        yield grid[:, left:ends[last - 1]], starts[first:last] - left, ends[first:last] - left
+        first = last
+
+
+def solve_grid_batch(grid, reading, solve_one, allow_modulo):
+    """
+    Shared batch driver: build the number matrix for the given reading,
+    fold all problems by operator, and re-solve unsafe ones with solve_one.
+    """
+    if grid.size == 0:
+        return 0
+    
+    starts, ends = find_problem_bounds(grid)
+    
+    total = 0
+    for band, band_starts, band_ends in problem_bands(grid, starts, ends):
+        digits, is_digit = digit_arrays(band)
+        numbers, counts = reading(digits, is_digit, band_starts, band_ends)
+        operators = problem_operators(band, band_starts, band_ends)
+        total += total_with_fallback(band, band_starts, band_ends, numbers, counts,
+                                     operators, solve_one, allow_modulo)
+    return total
+
+
+def solve_grid_both(grid):
+    """
+    Solve both readings of the worksheet from a single parse.
+    
+    Separator detection, digit extraction and operator lookup are shared;
+    only the place-value reduction differs between rows (Part 1) and
+    right-to-left columns (Part 2).
+    Returns (part1_total, part2_total).
+    """
+    if grid.size == 0:
+        return 0, 0
+    
+    starts, ends = find_problem_bounds(grid)
+    
+    part1 = part2 = 0
+    for band, band_starts, band_ends in problem_bands(grid, starts, ends):
+        digits, is_digit = digit_arrays(band)
+        operators = problem_operators(band, band_starts, band_ends)
+        
+        numbers, counts = row_numbers(digits, is_digit, band_starts, band_ends)
+        part1 += total_with_fallback(band, band_starts, band_ends, numbers, counts,
+                                     operators, solve_problem, allow_modulo=False)
+        
+        numbers, counts = column_numbers(digits, is_digit, band_starts, band_ends)
+        part2 += total_with_fallback(band, band_starts, band_ends, numbers, counts,
+                                     operators, solve_problem_part2, allow_modulo=True)
+    
+    return part1, part2
+
+
+def solve_grid_vectorized(grid):
+    """
+    Part 1: Batch-evaluate all problems with array operations.
+    """
+    return solve_grid_batch(grid, row_numbers, solve_problem, allow_modulo=False)
+
+
+def solve_grid_part2_vectorized(grid):
+    """
+    Part 2: Batch-evaluate all problems (right-to-left columns) with array operations.
+    """
+    return solve_grid_batch(grid, column_numbers, solve_problem_part2, allow_modulo=True)
+
+
+def solve_worksheet_vectorized(text):
+    """
+    Part 1 using the batch evaluator.
+    """
+    return solve_grid_vectorized(worksheet_grid(text))
+
+
+def solve_worksheet_part2_vectorized(text):
+    """
+    Part 2 using the batch evaluator.
+    """
+    return solve_grid_part2_vectorized(worksheet_grid(text))
+
+
+def solve_worksheet_both(text):
+    """
+    Parse the worksheet once and return (part1_total, part2_total).
+    """
+    return solve_grid_both(worksheet_grid(text))
+
+
+def product_tree(numbers):
+    """
+    Multiply numbers pairwise in a balanced tree.
+    
+    A left-to-right fold multiplies an ever-growing big int by small factors
+    (quadratic overall); pairing keeps both operands of each multiplication
+    similar in size, so CPython's Karatsuba multiply kicks in.
+    """
+    if not numbers:
+        return 1
+    
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    
+    return numbers[0]
+
+
+def solve_problem_tree(block):
+    """
+    Part 1 single-problem solver using product_tree for '*'.
+    """
+    numbers, operator = read_problem(block)
+    if not numbers:
+        return 0
+    if operator == '*':
+        return product_tree(numbers)
+    if operator == '+':
+        return sum(numbers)
+    return numbers[0]
+
+
+def solve_problem_part2_tree(block):
+    """
+    Part 2 single-problem solver using product_tree for '*'.
+    """
+    numbers, operator = read_problem_part2(block)
+    if not numbers:
+        return 0
+    if operator == '*':
+        return product_tree(numbers)
+    if operator == '+':
+        return sum(numbers)
+    
+    result = numbers[0]
+    if operator == '%':
+        for num in numbers[1:]:
+            result %= num
+    return result
+
+
+def solve_chunk(chunk, part):
+    """
+    Worker task: solve every problem in a contiguous slice of the grid.
+    Small results are batch-evaluated; big ones use product trees.
+    """
+    if part == 1:
+        return solve_grid_batch(chunk, row_numbers, solve_problem_tree, allow_modulo=False)
+    return solve_grid_batch(chunk, column_numbers, solve_problem_part2_tree, allow_modulo=True)
+
+
+def partition_problems(starts, ends, n_chunks):
+    """
+    Split problems into at most n_chunks runs of roughly equal column width.
+    Returns a list of (first_col, last_col) slices of the grid.
+    """
+    n_chunks = max(1, min(n_chunks, len(starts)))
+    
+    # Cut after the problem whose cumulative width reaches each equal share
+    widths = np.cumsum(ends - starts)
+    targets = widths[-1] * np.arange(1, n_chunks) / n_chunks
+    cuts = np.unique(np.searchsorted(widths, targets) + 1)
+    bounds = [0] + [c for c in cuts.tolist() if 0 < c < len(starts)] + [len(starts)]
+    
+    return [(int(starts[i]), int(ends[j - 1])) for i, j in zip(bounds, bounds[1:])]
+
+
+@contextmanager
+def module_pool(max_workers):
+    """
+    Process pool whose workers can unpickle this module's functions by name.
+    
+    The module may have been loaded by file path, so its directory is put on
+    sys.path while the pool runs; workers copy (spawn) or inherit (fork) the
+    parent's sys.path, so no initializer has to be importable first.
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    added = module_dir not in sys.path
+    if added:
+        sys.path.insert(0, module_dir)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            yield pool
+    finally:
+        if added:
+            sys.path.remove(module_dir)
+
+
+def solve_grid_parallel(grid, part=1, workers=None):
+    """
+    Solve all problems across a process pool and return the grand total.
+    
+    Problems are partitioned into contiguous column slices (a few per
+    worker for load balancing); each worker returns its subtotal.
+    """
+    if grid.size == 0:
+        return 0
+    
+    starts, ends = find_problem_bounds(grid)
+    if len(starts) == 0:
+        return 0
+    
+    workers = workers or os.cpu_count() or 1
+    chunks = [np.ascontiguousarray(grid[:, a:b])
+              for a, b in partition_problems(starts, ends, workers * 4)]
+    
+    with module_pool(workers) as pool:
+        return sum(pool.map(solve_chunk, chunks, [part] * len(chunks)))
+
+
+def solve_worksheet_parallel(text, workers=None):
+    """
+    Part 1 using a process pool.
+    """
+    return solve_grid_parallel(worksheet_grid(text), part=1, workers=workers)
+
+
+def solve_worksheet_part2_parallel(text, workers=None):
+    """
+    Part 2 using a process pool.
+    """
+    return solve_grid_parallel(worksheet_grid(text), part=2, workers=workers)
+
+
+# Standard entry points for the runner
+def parse(input_text):
+    """Runner hook: build the byte grid once for both parts."""
+    return worksheet_grid(input_text)
+
+
+def solve_part1(data):
+    """Part 1; data is the raw input text or the grid from parse()."""
+    grid = parse(data) if isinstance(data, str) else data
+    return solve_grid_vectorized(grid)
+
+
+def solve_part2(data):
+    """Part 2; data is the raw input text or the grid from parse()."""
+    grid = parse(data) if isinstance(data, str) else data
+    return solve_grid_part2_vectorized(grid)
+
+
+# Alternative implementations selectable with --backend (see runner.py)
+BACKENDS = {
+    "reference": {
+        "kind": "reference",
+        "description": "Per-problem Python evaluation",
+        "parse": parse,
+        "part1": solve_grid,
+        "part2": solve_grid_part2,
+    },
+    "vectorized": {
+        "kind": "vectorized",
+        "description": "Operator-grouped NumPy batch evaluation",
+        "parse": parse,
+        "part1": solve_grid_vectorized,
+        "part2": solve_grid_part2_vectorized,
+        "auto_min_bytes": 0,
+    },
+    "parallel": {
+        "kind": "parallel",
+        "description": "Process pool over column slices with product trees",
+        "parse": parse,
+        "part1": partial(solve_grid_parallel, part=1),
+        "part2": partial(solve_grid_parallel, part=2),
+        # Process start-up only pays off on very large worksheets
+        "auto_min_bytes": 50_000_000,
+    },
+}
+
 
 if __name__ == "__main__":
-    # Run on actual input
-    with open('day6_input.txt', 'r') as f:
-        input_text = f.read()
+    # Run on actual input (memory-mapped byte grid, shared by both parts)
+    grid = load_worksheet('day6_input.txt')
     
-    print(f"Part 1: {solve_part1(input_text)}")
-    print(f"Part 2: {solve_part2(input_text)}")
+    part1, part2 = solve_grid_both(grid)
+    print(f"Part 1: {part1}")
+    print(f"Part 2: {part2}")
@@ -4,13 +4,53 @@ Day 7: Tachyon Manifold Beam Splitter
 Part 1: Count beam splits in classical physics simulation
 Part 2: Count quantum timelines (many-worlds interpretation)
 
-Part 2 has TWO implementations:
+Part 1 also has simulate_beams_frontier(), which advances a bitset of the
+current row's beam columns instead of tracking every (row, col) visited.
+
+Part 2 implementations:
 1. count_quantum_timelines_dfs() - Top-down with @lru_cache memoization
 2. count_quantum_timelines_dp() - Bottom-up dynamic programming
+3. count_quantum_timelines_streaming() - Rolling-row DP over a line stream
+4. count_quantum_timelines_vectorized() - NumPy row transitions on a byte grid
+5. count_quantum_timelines_iterative() - Top-down with an explicit stack
+6. count_quantum_timelines_sparse() - Event-driven jumps between splitters
+7. count_quantum_timelines_banded() - Row blocks as banded transfers
+   (not a backend: several times slower than 4, kept as a cross-check)
+
+TimelineTable precomputes the timeline count from EVERY cell in one
+bottom-up pass, for answering many start-position queries.
 
-Both are O(rows × cols) time and space, produce identical results.
+All are O(rows × cols) time and produce identical results. The first two
+keep O(rows × cols) state; the streaming version keeps O(cols).
 """
 
+import bisect
+import heapq
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+EMPTY = ord('.')
+START = ord('S')
+SPLITTER = ord('^')
+
+# Counts can at most triple per row (pass-through plus two neighbours),
+# so switch to Python ints before the next row could overflow int64
+INT64_SAFE_MAX = (2**63 - 1) // 3
+
+INT64_MAX = 2**63 - 1
+
+# A single particle has at most 2**h paths after h rows, so transfers for
+# blocks of up to 62 rows are exact in int64
+MAX_BLOCK_ROWS = 62
+
+# Block work grows with the band width (2h + 1), so keep blocks short
+DEFAULT_BLOCK_ROWS = 4
+
 def parse_input(text):
     """Parse the tachyon manifold grid."""
     return [list(line) for line in text.strip().split('\n')]
@@ -83,6 +123,52 @@ def simulate_beams(grid):
     return split_count
 
 
+def bit_table(char):
+    """bytes.translate table mapping char -> '1' and every other byte -> '0'."""
+    return bytes(ord('1') if b == ord(char) else ord('0') for b in range(256))
+
+
+SPLITTER_BITS = bit_table('^')
+EMPTY_BITS = bit_table('.')
+
+
+def row_bitmask(row, table):
+    """Bitmask of the columns in row selected by table (bit c = column c)."""
+    bits = ''.join(row)[::-1].encode().translate(table)
+    return int(bits, 2) if bits else 0
+
+
+def simulate_beams_frontier(grid):
+    """
+    Part 1 with a row-at-a-time frontier.
+    
+    All beams move down in lockstep, so the only state is the set of
+    columns holding a beam on the current row, kept as a bitset int.
+    Duplicate beams merge for free and memory is O(cols).
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    
+    sr, sc = find_start(grid)
+    
+    frontier = 1 << sc
+    split_count = 0
+    
+    for r in range(sr + 1, rows):
+        hit = frontier & row_bitmask(grid[r], SPLITTER_BITS)
+        # int.bit_count() needs 3.10+
+        split_count += bin(hit).count('1')
+        
+        # Pass through empty space; splitters emit left and right
+        frontier = (frontier & row_bitmask(grid[r], EMPTY_BITS)) | (hit >> 1) | (hit << 1)
+        frontier &= (1 << cols) - 1
+        
+        if not frontier:
+            break
+    
+    return split_count
+
+
 def count_quantum_timelines_dfs(grid):
     """
     Part 2 (Approach 1): Count distinct timelines using memoized DFS.
@@ -140,6 +226,65 @@ def count_quantum_timelines_dfs(grid):
     return dfs(start_pos[0], start_pos[1])
 
 
+def count_quantum_timelines_iterative(grid):
+    """
+    Part 2 (Approach 1b): Top-down evaluation without recursion.
+    
+    Same recurrence as count_quantum_timelines_dfs, but driven by an explicit
+    stack and a flat memo list indexed by r * cols + c instead of lru_cache,
+    so tall grids never hit the recursion limit and the memo holds no tuples.
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    
+    sr, sc = find_start(grid)
+    
+    memo = [None] * (rows * cols)
+    
+    def children(r, c):
+        """Successor keys of (r, c), with None for a branch that exits."""
+        if r == rows - 1:
+            return ()
+        
+        nr = r + 1
+        cell = grid[nr][c]
+        
+        if cell == '.' or cell == 'S':
+            return (nr * cols + c,)
+        if cell == '^':
+            left = nr * cols + c - 1 if c - 1 >= 0 else None
+            right = nr * cols + c + 1 if c + 1 < cols else None
+            return (left, right)
+        
+        # Anything else ends the timeline here
+        return ()
+    
+    stack = [sr * cols + sc]
+    while stack:
+        key = stack[-1]
+        if memo[key] is not None:
+            stack.pop()
+            continue
+        
+        r, c = divmod(key, cols)
+        nexts = children(r, c)
+        
+        # Resolve unvisited successors first
+        pending = [k for k in nexts if k is not None and memo[k] is None]
+        if pending:
+            stack.extend(pending)
+            continue
+        
+        stack.pop()
+        if not nexts:
+            memo[key] = 1
+        else:
+            # An exiting branch (None) completes exactly one timeline
+            memo[key] = sum(1 if k is None else memo[k] for k in nexts)
+    
+    return memo[sr * cols + sc]
+
+
 def count_quantum_timelines_dp(grid):
     """
     Part 2 (Approach 2): Count distinct timelines using Dynamic Programming.
@@ -197,22 +342,572 @@ def count_quantum_timelines_dp(grid):
     return total_timelines
 
 
-def solve_part1(input_text):
-    """Count total number of beam splits."""
-    grid = parse_input(input_text)
+def count_quantum_timelines_streaming(lines):
+    """
+    Part 2 (Approach 3): Rolling-row DP that reads the manifold as a stream.
+    
+    lines is any iterable of row strings (e.g. an open file). Only the
+    counts for the current row are kept, so memory is O(cols) no matter
+    how tall the manifold is.
+    """
+    ways = None  # Particle counts on the current row (None until S is seen)
+    cols = 0
+    total_timelines = 0
+    
+    for line in lines:
+        row = line.rstrip('\r\n')
+        if not row:
+            continue
+        
+        if ways is None:
+            # Skip rows above the start
+            if 'S' in row:
+                cols = len(row)
+                ways = [0] * cols
+                ways[row.index('S')] = 1
+            continue
+        
+        # Move every particle on the current row down into this row
+        next_ways = [0] * cols
+        for c, w in enumerate(ways):
+            if w == 0:
+                continue
+            
+            cell = row[c]
+            if cell == '.' or cell == 'S':
+                next_ways[c] += w
+            elif cell == '^':
+                # Splitter: out-of-bounds branches complete their timelines
+                if c - 1 < 0:
+                    total_timelines += w
+                else:
+                    next_ways[c - 1] += w
+                
+                if c + 1 >= cols:
+                    total_timelines += w
+                else:
+                    next_ways[c + 1] += w
+        
+        ways = next_ways
+    
+    # Every particle left on the last row exits below the grid
+    if ways is not None:
+        total_timelines += sum(ways)
+    
+    return total_timelines
+
+
+def solve_part2_file(path):
+    """
+    Count quantum timelines streaming the manifold straight from a file.
+    """
+    with open(path, 'r') as f:
+        return count_quantum_timelines_streaming(f)
+
+
+def parse_array(text):
+    """Parse the manifold into a 2D uint8 array (one byte per cell)."""
+    lines = text.strip().split('\n')
+    data = ''.join(lines).encode()
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(lines), len(lines[0]))
+
+
+def grid_to_array(grid):
+    """Convert a list-of-lists grid (from parse_input) to a uint8 array."""
+    return parse_array('\n'.join(''.join(row) for row in grid))
+
+
+def find_start_array(arr):
+    """Find (row, col) of S in a uint8 manifold array."""
+    r, c = np.argwhere(arr == START)[0]
+    return int(r), int(c)
+
+
+def simulate_beams_vectorized(arr):
+    """
+    Part 1 on a uint8 array: the beam front is a boolean occupancy mask
+    that advances one whole row per step.
+    """
+    rows, cols = arr.shape
+    sr, sc = find_start_array(arr)
+    
+    active = np.zeros(cols, dtype=bool)
+    active[sc] = True
+    split_count = 0
+    
+    for r in range(sr + 1, rows):
+        row = arr[r]
+        hit = active & (row == SPLITTER)
+        split_count += int(hit.sum())
+        
+        # Pass straight through empty space; splitters emit left and right
+        active = active & (row == EMPTY)
+        active[:-1] |= hit[1:]
+        active[1:] |= hit[:-1]
+        
+        if not active.any():
+            break
+    
+    return split_count
+
+
+def count_quantum_timelines_vectorized(arr):
+    """
+    Part 2 on a uint8 array: one count vector per row, advanced with masked
+    shifts. Uses int64 while it is safe and object (Python int) arrays after.
+    """
+    rows, cols = arr.shape
+    sr, sc = find_start_array(arr)
+    
+    ways = np.zeros(cols, dtype=np.int64)
+    ways[sc] = 1
+    total_timelines = 0
+    
+    for r in range(sr + 1, rows):
+        if ways.dtype != object and ways.max() > INT64_SAFE_MAX:
+            ways = ways.astype(object)
+        
+        row = arr[r]
+        is_split = row == SPLITTER
+        hit = np.where(is_split, ways, 0)
+        
+        # '.' and 'S' pass through; other cells absorb the particle
+        next_ways = np.where((row == EMPTY) | (row == START), ways, 0)
+        next_ways[:-1] += hit[1:]
+        next_ways[1:] += hit[:-1]
+        
+        # Branches leaving the sides complete their timelines
+        total_timelines += int(hit[0]) + int(hit[-1])
+        ways = next_ways
+    
+    # Every particle left on the last row exits below the grid. Sum as
+    # Python ints: cells below INT64_SAFE_MAX can still total past 2**63
+    total_timelines += sum(ways.tolist())
+    
+    return total_timelines
+
+
+def build_splitter_index(grid):
+    """
+    Per-column sorted lists of the rows that stop a falling beam
+    (splitters, or any other non-'.' cell below the start).
+    """
+    cols = len(grid[0]) if grid else 0
+    index = [[] for _ in range(cols)]
+    
+    for r, row in enumerate(grid):
+        for m in re.finditer(r'[^.S]', ''.join(row)):
+            index[m.start()].append(r)
+    
+    return index
+
+
+def next_stop(index, r, c):
+    """Row of the first stopping cell strictly below (r, c), or None."""
+    stops = index[c]
+    i = bisect.bisect_right(stops, r)
+    return stops[i] if i < len(stops) else None
+
+
+def simulate_beams_sparse(grid, index=None):
+    """
+    Part 1 without stepping through empty rows.
+    
+    Each beam jumps straight to the next splitter in its column; splitters
+    are processed in row order from a heap, so beams that reach the same
+    splitter merge and work is proportional to splitters hit.
+    """
+    if index is None:
+        index = build_splitter_index(grid)
+    cols = len(index)
+    
+    sr, sc = find_start(grid)
+    
+    heap = []
+    queued = set()
+    
+    def drop(r, c):
+        """Let a beam at (r, c) fall to the next splitter."""
+        stop = next_stop(index, r, c)
+        if stop is not None and (stop, c) not in queued:
+            queued.add((stop, c))
+            heapq.heappush(heap, (stop, c))
+    
+    drop(sr, sc)
+    split_count = 0
+    
+    while heap:
+        r, c = heapq.heappop(heap)
+        if grid[r][c] != '^':
+            continue  # Blocked by something that isn't a splitter
+        
+        split_count += 1
+        if c - 1 >= 0:
+            drop(r, c - 1)
+        if c + 1 < cols:
+            drop(r, c + 1)
+    
+    return split_count
+
+
+def count_quantum_timelines_sparse(grid, index=None):
+    """
+    Part 2 without stepping through empty rows.
+    
+    Same event-driven scheme as simulate_beams_sparse, but each queued
+    splitter carries the number of particles arriving at it. The heap pops
+    splitters in row order, so every contribution has arrived before a
+    splitter is expanded.
+    """
+    if index is None:
+        index = build_splitter_index(grid)
+    cols = len(index)
+    
+    sr, sc = find_start(grid)
+    
+    heap = []
+    pending = {}  # (row, col) -> particles arriving at that splitter
+    total_timelines = 0
+    
+    def drop(r, c, w):
+        """Let w particles at (r, c) fall; returns timelines that exit."""
+        stop = next_stop(index, r, c)
+        if stop is None:
+            return w  # Falls out of the bottom
+        
+        key = (stop, c)
+        if key not in pending:
+            pending[key] = 0
+            heapq.heappush(heap, key)
+        pending[key] += w
+        return 0
+    
+    total_timelines += drop(sr, sc, 1)
+    
+    while heap:
+        r, c = heapq.heappop(heap)
+        w = pending.pop((r, c))
+        if grid[r][c] != '^':
+            continue  # Absorbed by something that isn't a splitter
+        
+        # Branches leaving the sides complete their timelines
+        total_timelines += w if c - 1 < 0 else drop(r, c - 1, w)
+        total_timelines += w if c + 1 >= cols else drop(r, c + 1, w)
+    
+    return total_timelines
+
+
+class TimelineTable:
+    """
+    Timeline counts from every cell of a manifold, computed bottom-up once.
+    
+    counts[r, c] is the number of timelines for a particle at (r, c) that
+    then moves down (what count_quantum_timelines_dp returns when S is at
+    (r, c)). After the O(rows × cols) precompute each query is O(1).
+    
+    Cells that are neither '.', 'S' nor '^' absorb particles, as in the DP.
+    """
+    
+    def __init__(self, arr):
+        self.arr = arr
+        self.rows, self.cols = arr.shape
+        self.counts = self._build_counts()
+    
+    def _step_up(self, below, row):
+        """
+        Counts for the row above, given counts for the row below and the
+        cells (row) the particles move into. Works on (cols,) count vectors
+        and on (cols, k) distribution matrices alike.
+        """
+        passes = (row == EMPTY) | (row == START)
+        is_split = row == SPLITTER
+        
+        # Column c splits into c - 1 and c + 1 of the row below
+        left = np.zeros_like(below)
+        left[1:] = below[:-1]
+        right = np.zeros_like(below)
+        right[:-1] = below[1:]
+        
+        shape = (-1,) + (1,) * (below.ndim - 1)
+        up = np.where(passes.reshape(shape), below, 0)
+        up = up + np.where(is_split.reshape(shape), left + right, 0)
+        return up
+    
+    def _build_counts(self):
+        """Fill counts from the bottom row upward."""
+        counts = np.zeros((self.rows, self.cols), dtype=np.int64)
+        
+        below = np.ones(self.cols, dtype=np.int64)
+        counts[-1] = below
+        
+        for r in range(self.rows - 2, -1, -1):
+            # Counts at most double per row; keep exact once int64 is unsafe
+            if below.dtype != object and below.max() > INT64_SAFE_MAX:
+                below = below.astype(object)
+                counts = counts.astype(object)
+            
+            row = self.arr[r + 1]
+            above = self._step_up(below, row)
+            
+            # A split branch leaving either side is one finished timeline
+            if row[0] == SPLITTER:
+                above[0] += 1
+            if row[-1] == SPLITTER:
+                above[-1] += 1
+            
+            counts[r] = above
+            below = above
+        
+        return counts
+    
+    def from_cell(self, r, c):
+        """Timelines for a particle starting at (r, c)."""
+        return int(self.counts[r, c])
+    
+    def from_start(self):
+        """Timelines from the manifold's own S (the Part 2 answer)."""
+        return self.from_cell(*find_start_array(self.arr))
+    
+    def from_columns(self, r):
+        """Timeline counts for a start at every column of row r."""
+        return [int(x) for x in self.counts[r]]
+    
+    def exit_distribution(self, r):
+        """
+        Where the timelines from row r end up.
+        
+        Returns a (cols, cols + 2) matrix: entry [c, e] counts timelines
+        starting at (r, c) that leave through the bottom of column e, with
+        e = cols for the left side and e = cols + 1 for the right side.
+        Rows sum to counts[r]. Costs O((rows - r) × cols²).
+        """
+        cols = self.cols
+        dist = np.zeros((cols, cols + 2), dtype=np.int64)
+        dist[:, :cols] = np.eye(cols, dtype=np.int64)
+        
+        for rr in range(self.rows - 2, r - 1, -1):
+            if dist.dtype != object and dist.max() > INT64_SAFE_MAX:
+                dist = dist.astype(object)
+            
+            row = self.arr[rr + 1]
+            above = self._step_up(dist, row)
+            if row[0] == SPLITTER:
+                above[0, cols] += 1
+            if row[-1] == SPLITTER:
+                above[-1, cols + 1] += 1
+            dist = above
+        
+        return dist
+
+
+def band_transfer(block):
+    """
+    Linear transfer of a block of rows, in banded form.
+    
+    block holds the h rows particles move into. A particle can drift at
+    most one column per row, so source column s only reaches columns
+    s - h .. s + h. Returns (transfer, exits): transfer[s, d] counts the
+    paths from column s (above the block) to column s + d - h of its last
+    row, and exits[s] counts those that leave through a side on the way.
+    """
+    h, cols = block.shape
+    width = 2 * h + 1
+    
+    # dest[s, d] = absolute column of band slot d for source s
+    dest = np.arange(cols)[:, None] + (np.arange(width) - h)[None, :]
+    inside = (dest >= 0) & (dest < cols)
+    dest_clipped = np.clip(dest, 0, cols - 1)
+    at_left = dest == 0
+    at_right = dest == cols - 1
+    
+    transfer = np.zeros((cols, width), dtype=np.int64)
+    transfer[:, h] = 1
+    exits = np.zeros(cols, dtype=np.int64)
+    
+    for row in block:
+        cells = row[dest_clipped]
+        hit = np.where(inside & (cells == SPLITTER), transfer, 0)
+        
+        # '.' and 'S' pass through; splitters move one slot left and right
+        transfer = np.where(inside & ((cells == EMPTY) | (cells == START)), transfer, 0)
+        transfer[:, :-1] += hit[:, 1:]
+        transfer[:, 1:] += hit[:, :-1]
+        transfer = np.where(inside, transfer, 0)
+        
+        # Branches leaving the sides complete their timelines
+        exits += np.where(at_left, hit, 0).sum(axis=1)
+        exits += np.where(at_right, hit, 0).sum(axis=1)
+    
+    return transfer, exits
+
+
+def fits_int64(a, b, terms):
+    """True if summing `terms` products of entries of a and b cannot overflow int64."""
+    return int(a.max(initial=0)) * int(b.max(initial=0)) * terms <= INT64_MAX
+
+
+def apply_transfer(ways, transfer):
+    """
+    Push a count vector through a banded transfer. Stays in int64 while
+    the products and sums provably fit, and switches to Python ints after.
+    """
+    cols, width = transfer.shape
+    h = (width - 1) // 2
+    if ways.dtype != object and not fits_int64(ways, transfer, width):
+        ways = ways.astype(object)
+    out = np.zeros(cols, dtype=ways.dtype)
+    
+    for d in range(width):
+        shift = d - h
+        if abs(shift) >= cols:
+            continue  # Band slot lies entirely outside the grid
+        contrib = ways * transfer[:, d]
+        if shift >= 0:
+            out[shift:] += contrib[:cols - shift]
+        else:
+            out[:shift] += contrib[-shift:]
+    
+    return out
+
+
+@contextmanager
+def module_pool(max_workers):
+    """
+    Process pool whose workers can unpickle this module's functions by name.
+    
+    The module may have been loaded by file path, so its directory is put on
+    sys.path while the pool runs; workers copy (spawn) or inherit (fork) the
+    parent's sys.path, so no initializer has to be importable first.
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    added = module_dir not in sys.path
+    if added:
+        sys.path.insert(0, module_dir)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            yield pool
+    finally:
+        if added:
+            sys.path.remove(module_dir)
+
+
+def count_quantum_timelines_banded(arr, block_rows=DEFAULT_BLOCK_ROWS, workers=None):
+    """
+    Part 2 (Approach 7): Parallel DP over horizontal row blocks.
+    
+    Workers build each block's banded transfer independently; the parent
+    then composes them by pushing the count vector from S through every
+    block in order (int64 while safe, Python ints after), so the total is
+    exact.
+    
+    Not a fast path: a block of h rows costs (2h + 1) times the plain row
+    DP, so the block work is several times the whole vectorized engine and
+    only breaks even with many idle cores. Composing blocks pairwise in a
+    tree would not help either, since merged bands widen to the full grid.
+    """
+    rows, cols = arr.shape
+    sr, sc = find_start_array(arr)
+    
+    block_rows = max(1, min(block_rows, MAX_BLOCK_ROWS))
+    body = arr[sr + 1:]
+    blocks = [np.ascontiguousarray(body[i:i + block_rows])
+              for i in range(0, len(body), block_rows)]
+    
+    if workers == 1 or len(blocks) <= 1:
+        transfers = list(map(band_transfer, blocks))
+    else:
+        with module_pool(workers) as pool:
+            transfers = list(pool.map(band_transfer, blocks))
+    
+    ways = np.zeros(cols, dtype=np.int64)
+    ways[sc] = 1
+    total_timelines = 0
+    
+    for transfer, exits in transfers:
+        if ways.dtype != object and not fits_int64(ways, exits, 1):
+            ways = ways.astype(object)
+        total_timelines += sum((ways * exits).tolist())
+        ways = apply_transfer(ways, transfer)
+    
+    # Every particle left on the last row exits below the grid
+    total_timelines += sum(ways.tolist())
+    
+    return total_timelines
+
+
+def parse(input_text):
+    """Runner hook: parse the grid once for both parts."""
+    return parse_input(input_text)
+
+
+def solve_part1(data):
+    """
+    Count total number of beam splits.
+    data is the raw input text or the grid from parse().
+    """
+    grid = parse(data) if isinstance(data, str) else data
     return simulate_beams(grid)
 
 
-def solve_part2(input_text):
+def solve_part2(data):
     """
     Count total number of quantum timelines.
     Uses DP approach (bottom-up). 
     Alternative: count_quantum_timelines_dfs (top-down with memoization).
+    data is the raw input text or the grid from parse().
     """
-    grid = parse_input(input_text)
+    grid = parse(data) if isinstance(data, str) else data
     return count_quantum_timelines_dp(grid)
 
 
+def parse_lines(text):
+    """Parse the manifold as a list of row strings (no per-cell lists)."""
+    return text.strip().split('\n')
+
+
+# Alternative implementations selectable with --backend (see runner.py)
+BACKENDS = {
+    "reference": {
+        "kind": "reference",
+        "description": "Beam simulation + row-by-row DP table",
+        "parse": parse_input,
+        "part1": simulate_beams,
+        "part2": count_quantum_timelines_dp,
+    },
+    "iterative": {
+        "kind": "reference",
+        "description": "Explicit-stack top-down DP",
+        "parse": parse_input,
+        "part1": simulate_beams,
+        "part2": count_quantum_timelines_iterative,
+    },
+    # The runner hands every backend the whole input text, so this one only
+    # bounds solver state; solve_part2_file() streams a file for real
+    "rolling": {
+        "kind": "low-memory",
+        "description": "Bitset frontier + rolling-row DP, O(cols) solver state",
+        "parse": parse_lines,
+        "part1": simulate_beams_frontier,
+        "part2": count_quantum_timelines_streaming,
+    },
+    "sparse": {
+        "kind": "sparse",
+        "description": "Per-column splitter index with heap-ordered jumps",
+        "parse": parse_input,
+        "part1": simulate_beams_sparse,
+        "part2": count_quantum_timelines_sparse,
+    },
+    "vectorized": {
+        "kind": "vectorized",
+        "description": "NumPy masked-shift row transitions",
+        "parse": parse_array,
+        "part1": simulate_beams_vectorized,
+        "part2": count_quantum_timelines_vectorized,
+        "auto_min_bytes": 100_000,
+    },
+}
+
+
 if __name__ == "__main__":
 
     with open('day7_input.txt', 'r') as f:
@@ -1,11 +1,20 @@
 import os
-import sys
-import importlib.util
+import csv
+import glob
+import json
+import time
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import print as rprint
 
+from runner import (DEFAULT_BACKEND, PARTS, PartResult, available_parts, backend_for,
+                    check_backend, format_bytes, format_ms, load_day_module, read_input,
+                    run_day_cached, solve_day, top_functions)
+
 console = Console()
 
 def get_completed_days():
@@ -19,63 +28,363 @@ def get_completed_days():
                 continue
     return sorted(days)
 
-def run_day(day_num):
+def backend_is_valid(days, backend):
+    """Check --backend against the days about to run; prints the valid names if it is unknown."""
+    modules = [module for module in map(load_day_module, days) if module]
+    try:
+        check_backend(backend, modules)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return False
+    return True
+
+def run_day_part(day_num, part, use_cache=True, backend=DEFAULT_BACKEND):
+    """
+    Run one part of one day; executed inside a worker process for --all.
+    Returns (day, part, parse_seconds, PartResult, cached, backend_used).
+    """
+    day_result = run_day_cached(day_num, parts=(part,), use_cache=use_cache, backend=backend)
+    if day_result is None:
+        return day_num, part, 0.0, PartResult(error="Module not found"), False, backend
+
+    result = day_result.parts.get(part, PartResult(error="Not implemented"))
+    return day_num, part, day_result.parse_wall, result, day_result.cached, day_result.backend
+
+def run_all(workers=None, use_cache=True, backend=DEFAULT_BACKEND):
+    """Run every part of every day in a process pool and show one results table."""
+    days = get_completed_days()
+    tasks = [(d, part) for d in days for part in PARTS]
+    # Days that don't declare the requested backend run their default
+    modules = {d: load_day_module(d) for d in days}
+    day_backends = {d: backend_for(m, backend) if m else backend for d, m in modules.items()}
+    results = {}
+    used_backends = {}
+
+    console.print(Panel("[bold blue]🎄 Running Advent of Code - All Days 🎄[/bold blue]", expand=False))
+
+    wall_start = time.perf_counter()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("[cyan]Solving...", total=len(tasks))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_day_part, d, part, use_cache, day_backends[d]) for d, part in tasks]
+            for future in as_completed(futures):
+                day_num, part, parse_wall, result, cached, used = future.result()
+                results[(day_num, part)] = (parse_wall, result, cached)
+                used_backends[day_num] = used
+                progress.update(task, description=f"[cyan]Day {day_num} Part {part} done")
+                progress.advance(task)
+    total_wall = time.perf_counter() - wall_start
+
+    table = Table(title="Results")
+    table.add_column("Day", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Parse", justify="right", style="dim", no_wrap=True)
+    table.add_column("Part 1", justify="right", style="bold white")
+    table.add_column("Wall / CPU", justify="right", style="dim", no_wrap=True)
+    table.add_column("Part 2", justify="right", style="bold white")
+    table.add_column("Wall / CPU", justify="right", style="dim", no_wrap=True)
+    if backend != DEFAULT_BACKEND:
+        table.add_column("Backend", style="green", no_wrap=True)
+
+    def cells(result, cached):
+        shown = f"[red]{result.error}[/red]" if result.error else str(result.answer)
+        timing = f"{result.wall * 1000:.1f} / {result.cpu * 1000:.1f} ms"
+        return shown, timing + (" ⚡" if cached else "")
+
+    for d in days:
+        # Each part's worker parses on its own; show the larger parse time
+        parse_wall = max(results[(d, part)][0] for part in PARTS)
+        row = [f"Day {d}", format_ms(parse_wall)]
+        for part in PARTS:
+            row.extend(cells(*results[(d, part)][1:]))
+        if backend != DEFAULT_BACKEND:
+            row.append(used_backends[d])
+        table.add_row(*row)
+
+    console.print(table)
+
+    summed = sum(parse_wall + result.wall for parse_wall, result, _ in results.values())
+    console.print(f"\n[dim]Elapsed {total_wall:.2f}s (sum of parts {summed:.2f}s)[/dim]")
+    if any(cached for _, _, cached in results.values()):
+        console.print("[dim]⚡ served from cache (use --no-cache to re-run)[/dim]")
+
+def run_day(day_num, use_cache=True, backend=DEFAULT_BACKEND):
     day_dir = f"day{day_num}"
     script_path = os.path.join(day_dir, f"day{day_num}.py")
-    input_path = os.path.join(day_dir, f"day{day_num}_input.txt")
-    
+
     if not os.path.exists(script_path):
         console.print(f"[red]Error: {script_path} not found[/red]")
         return
 
-    # Load module dynamically
-    spec = importlib.util.spec_from_file_location(f"day{day_num}", script_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[f"day{day_num}"] = module
-    spec.loader.exec_module(module)
-    
-    # Read input
-    if os.path.exists(input_path):
-        with open(input_path, 'r') as f:
-            input_text = f.read()
-    else:
-        input_text = ""
+    if read_input(day_num) is None:
         console.print("[yellow]Warning: Input file not found[/yellow]")
 
     console.print(Panel(f"[bold blue]🎄 Running Advent of Code - Day {day_num} 🎄[/bold blue]", expand=False))
-    
-    # Part 1
-    if hasattr(module, 'solve_part1'):
-        try:
-            p1 = module.solve_part1(input_text)
-            console.print(f"[green]Part 1:[/green] [bold white]{p1}[/bold white]")
-        except Exception as e:
-            console.print(f"[red]Part 1 Error:[/red] {e}")
-    
-    # Part 2
-    if hasattr(module, 'solve_part2'):
-        try:
-            p2 = module.solve_part2(input_text)
-            console.print(f"[green]Part 2:[/green] [bold white]{p2}[/bold white]")
-        except Exception as e:
-            console.print(f"[red]Part 2 Error:[/red] {e}")
+
+    # Parse once, then run both parts on the parsed input (or serve them from the cache)
+    day_result = run_day_cached(day_num, use_cache=use_cache, backend=backend)
+    if day_result.parse_error:
+        console.print(f"[red]Parse Error:[/red] {day_result.parse_error}")
+        return
+    if day_result.cached:
+        console.print("[dim]Served from cache (use --no-cache to re-run)[/dim]")
+    if day_result.backend != DEFAULT_BACKEND:
+        console.print(f"[dim]Backend: {day_result.backend}[/dim]")
+    if day_result.parse_wall:
+        console.print(f"[dim]Parse: {format_ms(day_result.parse_wall)}[/dim]")
+
+    for part, result in day_result.parts.items():
+        if result.error:
+            console.print(f"[red]Part {part} Error:[/red] {result.error}")
+        else:
+            console.print(f"[green]Part {part}:[/green] [bold white]{result.answer}[/bold white] "
+                          f"[dim]({format_ms(result.wall)})[/dim]")
+
+def profile_day(day_num, backend=DEFAULT_BACKEND, dump_dir=None, top=15):
+    """
+    Run a day uncached with per-part wall / CPU time and tracemalloc peak memory.
+    With dump_dir, each part also runs under cProfile; the pstats files are
+    written there and the top hot functions of each part are listed.
+    """
+    module = load_day_module(day_num)
+    input_text = read_input(day_num)
+    if module is None or input_text is None:
+        console.print(f"[red]Error: day {day_num} script or input not found[/red]")
+        return
+
+    console.print(Panel(f"[bold blue]🔬 Profiling Advent of Code - Day {day_num} 🔬[/bold blue]", expand=False))
+
+    day_result = solve_day(module, input_text, backend=backend,
+                           profile=True, profile_dir=dump_dir)
+    if day_result.parse_error:
+        console.print(f"[red]Parse Error:[/red] {day_result.parse_error}")
+        return
+
+    table = Table(title=f"Day {day_num} ({day_result.backend}) - parse {format_ms(day_result.parse_wall)}")
+    table.add_column("Part", justify="right", style="cyan")
+    table.add_column("Answer", justify="right", style="bold white")
+    table.add_column("Wall", justify="right")
+    table.add_column("CPU", justify="right")
+    table.add_column("Peak memory", justify="right")
+    for part, result in day_result.parts.items():
+        answer = f"[red]{result.error}[/red]" if result.error else str(result.answer)
+        peak = format_bytes(result.peak_memory) if result.peak_memory is not None else "-"
+        table.add_row(str(part), answer, format_ms(result.wall), format_ms(result.cpu), peak)
+    console.print(table)
+    console.print("[dim]Timings include tracemalloc/cProfile overhead; "
+                  "worker processes of parallel backends are not traced.[/dim]")
+
+    for part, result in day_result.parts.items():
+        if not result.profile_path:
+            continue
+        hot = Table(title=f"Part {part}: top {top} functions by own time")
+        hot.add_column("Function", style="green", overflow="fold")
+        hot.add_column("Calls", justify="right")
+        hot.add_column("Own", justify="right")
+        hot.add_column("Cumulative", justify="right")
+        for label, ncalls, tottime, cumtime in top_functions(result.profile_path, top):
+            hot.add_row(label, str(ncalls), format_ms(tottime), format_ms(cumtime))
+        console.print(hot)
+        console.print(f"[dim]Full stats: {result.profile_path} "
+                      f"(python -m pstats {result.profile_path})[/dim]")
+
+# Batch mode: one day against many input files. Each worker process loads the
+# day module once (pool initializer) and reuses it for every file it solves.
+BATCH_FIELDS = ["input", "bytes", "backend", "parse_ms",
+                "part1", "part1_ms", "part2", "part2_ms", "error"]
+
+_batch_module = None
+_batch_backend = DEFAULT_BACKEND
+
+def batch_inputs(source):
+    """Input files for a batch: every file in a directory, or the matches of a glob."""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source, recursive=True)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+def init_batch_worker(day_num, backend):
+    global _batch_module, _batch_backend
+    _batch_module = load_day_module(day_num)
+    _batch_backend = backend
+
+def solve_batch_file(path):
+    """Solve one input file with the worker's module; returns a BATCH_FIELDS row."""
+    row = {"input": path}
+    try:
+        with open(path, 'r') as f:
+            input_text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        # Unreadable or non-text files are reported, not fatal to the batch
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+
+    day_result = solve_day(_batch_module, input_text, available_parts(_batch_module),
+                           _batch_backend)
+    row.update(bytes=len(input_text), backend=day_result.backend,
+               parse_ms=round(day_result.parse_wall * 1000, 3))
+    errors = []
+    for part, result in day_result.parts.items():
+        row[f"part{part}_ms"] = round(result.wall * 1000, 3)
+        if result.error:
+            errors.append(f"P{part}: {result.error}")
+        else:
+            row[f"part{part}"] = result.answer
+    if errors:
+        row["error"] = "; ".join(errors)
+    return row
+
+class BatchWriter:
+    """Streams result rows to CSV, or to JSON lines when the path ends in .jsonl."""
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='')
+        self.jsonl = path.endswith(".jsonl")
+        if not self.jsonl:
+            self.csv = csv.DictWriter(self.file, fieldnames=BATCH_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.jsonl:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            self.csv.writerow(row)
+        # Flush per row so partial results survive an interrupted batch
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+def run_batch(day_num, source, out_path=None, workers=None, max_in_flight=None,
+              backend=DEFAULT_BACKEND):
+    """
+    Solve a day for every input matched by source across a process pool.
+    At most max_in_flight files are queued or running at once (default: 4 per
+    worker), so huge batches don't hold every pending task in memory; rows
+    are written to out_path as they complete.
+    """
+    if load_day_module(day_num) is None:
+        console.print(f"[red]Error: day {day_num} not found[/red]")
+        return
+
+    paths = batch_inputs(source)
+    if not paths:
+        console.print(f"[red]No input files match {source}[/red]")
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    out_path = out_path or f"day{day_num}_batch.csv"
+
+    console.print(Panel(f"[bold blue]🎄 Day {day_num} batch: {len(paths)} inputs 🎄[/bold blue]", expand=False))
+
+    writer = BatchWriter(out_path)
+    failures = 0
+    wall_start = time.perf_counter()
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+            console=console,
+            transient=True,
+        ) as progress, ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                           initargs=(day_num, backend)) as pool:
+            task = progress.add_task("[cyan]Solving...", total=len(paths))
+            pending = iter(paths)
+            in_flight = set()
+            while True:
+                for path in pending:
+                    in_flight.add(pool.submit(solve_batch_file, path))
+                    if len(in_flight) >= max_in_flight:
+                        break
+                if not in_flight:
+                    break
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    row = future.result()
+                    failures += bool(row.get("error"))
+                    writer.write(row)
+                    progress.advance(task)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - wall_start
+    console.print(f"[green]Solved {len(paths) - failures}/{len(paths)} inputs[/green] "
+                  f"in {elapsed:.2f}s ({len(paths) / elapsed:.1f} inputs/s) → {out_path}")
+    if failures:
+        console.print(f"[red]{failures} input(s) failed; see the error column[/red]")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Advent of Code 2025 runner")
+    parser.add_argument("day", nargs="?", help="Day number to run")
+    parser.add_argument("--all", action="store_true",
+                        help="Run every day in parallel and show a results table")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for --all and --batch (default: CPU count)")
+    parser.add_argument("--batch", metavar="DIR_OR_GLOB", default=None,
+                        help="Solve the given day for every input in a directory or glob "
+                             "(e.g. 'tenants/*.txt')")
+    parser.add_argument("--out", metavar="PATH", default=None,
+                        help="Batch results file, CSV or .jsonl (default: day<N>_batch.csv)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Batch inputs queued or running at once (default: 4 per worker)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached results and re-run every part")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND,
+                        help='Implementation to use where a day declares BACKENDS '
+                             '(e.g. reference, vectorized, parallel), or "auto" to pick by input size')
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile a day: wall / CPU time and peak memory per part (bypasses the cache)")
+    parser.add_argument("--profile-dump", metavar="DIR", default=None,
+                        help="With --profile, also run cProfile, write pstats files to DIR "
+                             "and list the hottest functions")
+    parser.add_argument("--profile-top", metavar="N", type=int, default=15,
+                        help="Number of hot functions to list per part (default: 15)")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+
+    if args.all:
+        if not backend_is_valid(get_completed_days(), args.backend):
+            return
+        run_all(args.workers, use_cache=not args.no_cache, backend=args.backend)
+        return
+
     # Check if a specific day is requested
-    if len(sys.argv) > 1:
+    if args.day is not None:
         try:
-            day_to_run = int(sys.argv[1])
-            run_day(day_to_run)
-            return
+            day_to_run = int(args.day)
         except ValueError:
             console.print("[red]Invalid day number[/red]")
             return
-    
+        if not backend_is_valid([day_to_run], args.backend):
+            return
+
+        if args.batch:
+            run_batch(day_to_run, args.batch, args.out, args.workers,
+                      args.max_in_flight, args.backend)
+        elif args.profile or args.profile_dump:
+            profile_day(day_to_run, args.backend, args.profile_dump, args.profile_top)
+        else:
+            run_day(day_to_run, use_cache=not args.no_cache, backend=args.backend)
+        return
+
     # No specific day requested - show dashboard
     rprint("[bold green]Welcome to the AI Pair Programming AoC Runner! 🤖[/bold green]")
-    
+
     days = get_completed_days()
-    
+
     table = Table(title="Completed Puzzles")
     table.add_column("Day", justify="right", style="cyan", no_wrap=True)
     table.add_column("Status", style="magenta")
@@ -97,7 +406,10 @@ def main():
 
     console.print(table)
     console.print("\n[dim]Run specific day: python main.py <day_num>[/dim]")
+    console.print("[dim]Run all days in parallel: python main.py --all[/dim]")
+    console.print("[dim]Pick an implementation: python main.py 7 --backend vectorized (or auto)[/dim]")
+    console.print("[dim]Profile a day: python main.py 6 --profile [--profile-dump profiles][/dim]")
+    console.print("[dim]Solve many inputs: python main.py 6 --batch 'inputs/*.txt' --out results.jsonl[/dim]")
 
 if __name__ == "__main__":
     main()
-
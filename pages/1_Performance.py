@@ -0,0 +1,205 @@
+import streamlit as st
+import os
+import json
+
+import pandas as pd
+
+import runner
+from benchmarks import history
+
+st.set_page_config(
+    page_title="AoC 2025 - Performance",
+    page_icon="⏱️",
+    layout="wide"
+)
+
+SCALING_FILE = os.path.join("benchmarks", "scaling.json")
+BASELINE_FILE = "perf_baselines.json"
+
+def file_mtime(path):
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+# Result files are re-read only when they change (same idea as the main page)
+@st.cache_data(show_spinner=False)
+def load_history(path, mtime):
+    records = history.load_records(path)
+    if not records:
+        return pd.DataFrame()
+    df = pd.DataFrame.from_records(records)
+    df["machine_id"] = df["machine"].map(lambda m: m["id"])
+    df["machine_name"] = df["machine"].map(lambda m: m["description"])
+    df["commit_short"] = df["commit"].fillna("unknown").str[:7] + df["dirty"].map({True: "+", False: ""})
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df["wall_ms"] = df["wall"] * 1000
+    df["cpu_ms"] = df["cpu"] * 1000
+    # Only runs recorded with --memory carry a peak
+    peak = df["peak_memory"] if "peak_memory" in df else pd.Series(index=df.index, dtype=float)
+    df["peak_kib"] = pd.to_numeric(peak, errors="coerce") / 1024
+    return df.drop(columns=["machine"])
+
+@st.cache_data(show_spinner=False)
+def load_scaling(path, mtime):
+    """Flatten a `python -m benchmarks.scaling --json` file to one row per point and part."""
+    with open(path, 'r') as f:
+        results = json.load(f)
+    rows = []
+    for day, entry in results.items():
+        for point in entry["points"]:
+            if point.get("skipped"):
+                continue
+            for part, seconds in point["parts"].items():
+                rows.append({
+                    "day": int(day),
+                    "part": int(part),
+                    "scale": point["scale"],
+                    "bytes": point["bytes"],
+                    "backend": point["backend"],
+                    "ms": seconds * 1000,
+                    "mb_per_s": point["bytes"] / (point["parse"] + seconds) / 1e6,
+                })
+    return pd.DataFrame(rows)
+
+@st.cache_data(show_spinner=False)
+def load_baselines(path, mtime):
+    with open(path, 'r') as f:
+        timings = json.load(f).get("timings", {})
+    rows = []
+    for day, backends in timings.items():
+        for backend, steps in backends.items():
+            # Steps are "parse", "part1", "part2"
+            for step, seconds in steps.items():
+                rows.append({"day": int(day[3:]), "step": step,
+                             "backend": backend, "wall_ms": seconds * 1000})
+    return pd.DataFrame(rows)
+
+def latest_per_key(df):
+    """Median of the newest commit's records for every (day, part, backend)."""
+    newest = df.sort_values("timestamp").groupby(["day", "part", "backend"])["commit_short"].last()
+    latest = df.merge(newest.rename("newest"), left_on=["day", "part", "backend"], right_index=True)
+    latest = latest[latest["commit_short"] == latest["newest"]]
+    return (latest.groupby(["day", "part", "backend"], as_index=False)
+            .agg(wall_ms=("wall_ms", "median"), cpu_ms=("cpu_ms", "median"),
+                 peak_kib=("peak_kib", "max"), commit=("commit_short", "last")))
+
+# Sidebar
+st.sidebar.title("⏱️ Performance")
+st.sidebar.markdown("Timings from `benchmarks/history.jsonl`, `perf_baselines.json` "
+                    "and `benchmarks/scaling.json`.")
+
+st.title("⏱️ Performance Dashboard")
+
+history_df = load_history(history.HISTORY_FILE, file_mtime(history.HISTORY_FILE))
+
+if history_df.empty:
+    st.info("No benchmark history yet. Record some with "
+            "`python -m benchmarks.history record --backend all --memory`.")
+else:
+    machines = history_df[["machine_id", "machine_name"]].drop_duplicates()
+    labels = {row.machine_id: f"{row.machine_name} ({row.machine_id})"
+              for row in machines.itertuples()}
+    machine = st.sidebar.selectbox("Machine", list(labels), format_func=labels.get)
+    history_df = history_df[history_df["machine_id"] == machine]
+    latest = latest_per_key(history_df)
+
+    # Latest timings: which days need faster engines
+    st.subheader("🐢 Slowest parts (latest commit per day / part / backend)")
+    default_only = latest[latest["backend"] == runner.DEFAULT_BACKEND]
+    st.bar_chart(default_only.assign(label="Day " + default_only["day"].astype(str),
+                                     part="Part " + default_only["part"].astype(str)),
+                 x="label", y="wall_ms", color="part")
+    st.dataframe(
+        latest.sort_values("wall_ms", ascending=False),
+        hide_index=True,
+        column_config={
+            "wall_ms": st.column_config.NumberColumn("Wall (ms)", format="%.2f"),
+            "cpu_ms": st.column_config.NumberColumn("CPU (ms)", format="%.2f"),
+            "peak_kib": st.column_config.NumberColumn("Peak memory (KiB)", format="%.1f"),
+        },
+    )
+
+    # Backend comparison for one day
+    st.markdown("---")
+    st.subheader("⚔️ Backends side by side")
+    multi = sorted(latest.groupby("day")["backend"].nunique().loc[lambda n: n > 1].index)
+    if not multi:
+        st.info("Record several backends with `python -m benchmarks.history record --backend all`.")
+    else:
+        day = st.selectbox("Day", multi, index=len(multi) - 1)
+        day_df = latest[latest["day"] == day].copy()
+        reference = (day_df[day_df["backend"] == runner.DEFAULT_BACKEND]
+                     .set_index("part")["wall_ms"])
+        day_df["speedup_vs_default"] = reference.reindex(day_df["part"]).values / day_df["wall_ms"]
+        day_df["part"] = "Part " + day_df["part"].astype(str)
+        st.bar_chart(day_df, x="backend", y="wall_ms", color="part")
+        st.dataframe(
+            day_df[["backend", "part", "wall_ms", "cpu_ms", "peak_kib", "speedup_vs_default"]],
+            hide_index=True,
+            column_config={
+                "wall_ms": st.column_config.NumberColumn("Wall (ms)", format="%.2f"),
+                "cpu_ms": st.column_config.NumberColumn("CPU (ms)", format="%.2f"),
+                "peak_kib": st.column_config.NumberColumn("Peak memory (KiB)", format="%.1f"),
+                "speedup_vs_default": st.column_config.NumberColumn("× vs default", format="%.2f×"),
+            },
+        )
+
+    # Trend across commits
+    st.markdown("---")
+    st.subheader("📈 Trend across commits")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        trend_day = st.selectbox("Trend day", sorted(history_df["day"].unique()))
+    with col2:
+        trend_part = st.selectbox("Trend part", list(runner.PARTS))
+    with col3:
+        trend_backend = st.selectbox("Trend backend", sorted(history_df["backend"].unique()))
+    trend_df = history_df[(history_df["day"] == trend_day) & (history_df["part"] == trend_part)
+                          & (history_df["backend"] == trend_backend)]
+    trend_df = (trend_df.groupby("commit_short", as_index=False)
+                .agg(wall_ms=("wall_ms", "median"), timestamp=("timestamp", "min"))
+                .sort_values("timestamp"))
+    if trend_df.empty:
+        st.info("Nothing recorded for this combination.")
+    else:
+        st.line_chart(trend_df, x="timestamp", y="wall_ms")
+        st.caption(" → ".join(trend_df["commit_short"]))
+
+# Scaling curves from the synthetic-input benchmark
+st.markdown("---")
+st.subheader("📐 Scaling curves")
+if not os.path.exists(SCALING_FILE):
+    st.info(f"Run `python -m benchmarks.scaling --json {SCALING_FILE}` to chart how each "
+            "day scales from 1× to 1000× the real input size.")
+else:
+    scaling_df = load_scaling(SCALING_FILE, file_mtime(SCALING_FILE))
+    scaling_df["series"] = "Day " + scaling_df["day"].astype(str) + " P" + scaling_df["part"].astype(str)
+    # Log-log axes: a straight line's slope is the empirical complexity exponent
+    st.vega_lite_chart(scaling_df, {
+        "mark": {"type": "line", "point": True},
+        "encoding": {
+            "x": {"field": "bytes", "type": "quantitative", "scale": {"type": "log"},
+                  "title": "Input size (bytes)"},
+            "y": {"field": "ms", "type": "quantitative", "scale": {"type": "log"},
+                  "title": "Time (ms)"},
+            "color": {"field": "series", "type": "nominal"},
+            "tooltip": [{"field": "series"}, {"field": "scale"}, {"field": "ms"},
+                        {"field": "mb_per_s", "title": "MB/s"}],
+        },
+    }, use_container_width=True)
+    largest = scaling_df.sort_values("bytes").groupby("series", as_index=False).last()
+    st.dataframe(
+        largest[["series", "scale", "bytes", "ms", "mb_per_s"]].sort_values("mb_per_s"),
+        hide_index=True,
+        column_config={
+            "ms": st.column_config.NumberColumn("Time (ms)", format="%.1f"),
+            "mb_per_s": st.column_config.NumberColumn("Throughput (MB/s)", format="%.3f"),
+        },
+    )
+
+# Committed perf-gate baselines
+if os.path.exists(BASELINE_FILE):
+    with st.expander("📌 Perf gate baselines (perf_baselines.json)"):
+        st.dataframe(load_baselines(BASELINE_FILE, file_mtime(BASELINE_FILE)), hide_index=True)
+
+# Footer
+st.sidebar.markdown("---")
+st.sidebar.markdown("Developed with ❤️ by Human & AI")
@@ -0,0 +1,466 @@
+"""
+Shared helpers for loading and running day solutions.
+
+Used by main.py, test_solutions.py and app.py so all three run days the
+same way.
+
+Parse-once protocol: a day module may define an optional
+``parse(input_text)`` hook. When it does, the input is parsed once and the
+parsed structure is passed to both ``solve_part1`` and ``solve_part2``;
+otherwise both parts receive the raw text (the original signature).
+
+Backends: a day module may also declare alternative implementations in a
+``BACKENDS`` dict mapping a name to a spec::
+
+    BACKENDS = {
+        "vectorized": {
+            "kind": "vectorized",          # reference / vectorized / parallel / low-memory ...
+            "description": "NumPy row transitions",
+            "parse": parse_array,          # optional; raw text is passed without it
+            "part1": simulate_beams_vectorized,
+            "part2": count_quantum_timelines_vectorized,
+            "auto_min_bytes": 100_000,     # optional; see select_backend()
+        },
+    }
+
+The "default" backend is always the module's own parse / solve_part1 /
+solve_part2, and "auto" picks the fastest backend for the input size.
+"""
+
+import os
+import sys
+import json
+import time
+import cProfile
+import hashlib
+import platform
+import pstats
+import statistics
+import tracemalloc
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+PARTS = (1, 2)
+
+DEFAULT_BACKEND = "default"
+AUTO_BACKEND = "auto"
+
+CACHE_DIR = ".aoc_cache"
+
+
+@dataclass
+class PartResult:
+    """Answer and timings for one part."""
+    answer: Any = None
+    wall: float = 0.0
+    cpu: float = 0.0
+    error: Optional[str] = None
+    peak_memory: Optional[int] = None
+    profile_path: Optional[str] = None
+
+
+@dataclass
+class DayResult:
+    """Parse timing plus the result of each part."""
+    parse_wall: float = 0.0
+    parse_error: Optional[str] = None
+    parts: Dict[int, PartResult] = field(default_factory=dict)
+    cached: bool = False
+    backend: str = DEFAULT_BACKEND
+
+
+def script_path(day_num):
+    return os.path.join(f"day{day_num}", f"day{day_num}.py")
+
+
+def input_path(day_num):
+    return os.path.join(f"day{day_num}", f"day{day_num}_input.txt")
+
+
+def load_day_module(day_num):
+    """Dynamically load a day's module. Returns None if the script is missing."""
+    path = script_path(day_num)
+    if not os.path.exists(path):
+        return None
+
+    spec = importlib.util.spec_from_file_location(f"day{day_num}", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[f"day{day_num}"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_input(day_num):
+    """Read a day's input file. Returns None if it is missing."""
+    path = input_path(day_num)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def available_parts(module):
+    """Parts the module implements (solve_part1 / solve_part2)."""
+    return tuple(part for part in PARTS if hasattr(module, f"solve_part{part}"))
+
+
+def get_backends(module):
+    """The module's BACKENDS registry (empty if it declares none)."""
+    return getattr(module, 'BACKENDS', {})
+
+
+def backend_names(module):
+    """All backend names a module can run, "default" first."""
+    return [DEFAULT_BACKEND] + list(get_backends(module))
+
+
+def select_backend(module, requested, input_size):
+    """
+    Resolve a requested backend name for this module and input.
+
+    "auto" picks, among backends declaring ``auto_min_bytes``, the one with
+    the largest threshold not above input_size (bigger inputs unlock
+    heavier engines), falling back to "default" when there is no candidate.
+    Any other name must be one of backend_names(module); unknown names
+    raise ValueError listing the valid ones.
+    """
+    backends = get_backends(module)
+
+    if requested == AUTO_BACKEND:
+        candidates = [(spec["auto_min_bytes"], name) for name, spec in backends.items()
+                      if spec.get("auto_min_bytes") is not None
+                      and spec["auto_min_bytes"] <= input_size]
+        return max(candidates)[1] if candidates else DEFAULT_BACKEND
+
+    if requested in backend_names(module):
+        return requested
+    raise ValueError(f"Unknown backend {requested!r} for {module.__name__}; "
+                     f"valid names: {', '.join(backend_names(module) + [AUTO_BACKEND])}")
+
+
+def check_backend(requested, modules, extra=()):
+    """
+    Validate a backend name for a run over several day modules: it must be
+    "auto", one of `extra` (e.g. "all") or declared by at least one module.
+    Raises ValueError listing the valid names.
+    """
+    valid = [DEFAULT_BACKEND]
+    for module in modules:
+        valid += [name for name in get_backends(module) if name not in valid]
+    valid += [AUTO_BACKEND, *extra]
+    if requested not in valid:
+        raise ValueError(f"Unknown backend {requested!r}; valid names: {', '.join(valid)}")
+
+
+def backend_for(module, requested):
+    """
+    The backend to run a module with when `requested` was given for several
+    days at once (after check_backend): the name itself where the module
+    declares it, else "default".
+    """
+    if requested == AUTO_BACKEND or requested in backend_names(module):
+        return requested
+    return DEFAULT_BACKEND
+
+
+def backend_parser(module, backend):
+    """The parse function a backend uses (None means "pass the raw text")."""
+    if backend == DEFAULT_BACKEND:
+        return getattr(module, 'parse', None)
+    return get_backends(module)[backend].get("parse")
+
+
+def backend_solver(module, backend, part):
+    """The solver a backend uses for a part (None if it has none)."""
+    if backend == DEFAULT_BACKEND:
+        return getattr(module, f"solve_part{part}", None)
+    return get_backends(module)[backend].get(f"part{part}")
+
+
+def parse_once(module, input_text, backend=DEFAULT_BACKEND):
+    """
+    Apply the backend's parse hook if it has one.
+    Returns (data, wall_seconds); data is the raw text without a hook.
+    """
+    parse = backend_parser(module, backend)
+    if parse is None:
+        return input_text, 0.0
+
+    start = time.perf_counter()
+    data = parse(input_text)
+    return data, time.perf_counter() - start
+
+
+def run_part(module, part, data, backend=DEFAULT_BACKEND, profile=False, profile_path=None):
+    """
+    Call the backend's solver for a part on data, with wall and CPU timing.
+
+    With profile=True the call is also traced with tracemalloc to record its
+    peak memory; with a profile_path it additionally runs under cProfile and
+    the stats are written there (a pstats file). Both add overhead, so
+    profiled timings are only comparable with other profiled runs.
+    """
+    solver = backend_solver(module, backend, part)
+    if solver is None:
+        return PartResult(error="Not implemented")
+
+    profiler = cProfile.Profile() if profile_path else None
+    if profile:
+        tracemalloc.start()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        if profiler:
+            profiler.enable()
+        result = PartResult(answer=solver(data))
+    except Exception as e:
+        result = PartResult(error=str(e))
+    finally:
+        if profiler:
+            profiler.disable()
+    result.wall = time.perf_counter() - wall_start
+    result.cpu = time.process_time() - cpu_start
+
+    if profile:
+        result.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if profiler:
+        os.makedirs(os.path.dirname(profile_path) or ".", exist_ok=True)
+        profiler.dump_stats(profile_path)
+        result.profile_path = profile_path
+    return result
+
+
+def solve_day(module, input_text, parts=PARTS, backend=DEFAULT_BACKEND,
+              profile=False, profile_dir=None):
+    """
+    Parse the input once and run the requested parts on it.
+    backend may be any name accepted by select_backend (including "auto").
+    profile / profile_dir enable per-part profiling (see run_part); pstats
+    files are written as profile_dir/<module>_part<N>.prof.
+    """
+    backend = select_backend(module, backend, len(input_text))
+    day_result = DayResult(backend=backend)
+
+    try:
+        data, day_result.parse_wall = parse_once(module, input_text, backend)
+    except Exception as e:
+        day_result.parse_error = str(e)
+        for part in parts:
+            day_result.parts[part] = PartResult(error=f"Parse error: {e}")
+        return day_result
+
+    for part in parts:
+        profile_path = None
+        if profile_dir:
+            profile_path = os.path.join(profile_dir, f"{module.__name__}_part{part}.prof")
+        day_result.parts[part] = run_part(module, part, data, backend,
+                                          profile=profile, profile_path=profile_path)
+    return day_result
+
+
+def solve_day_streaming(day_num, backend, parts, events):
+    """
+    Worker-process entry point: solve a day and report progress on `events`
+    (a multiprocessing queue) as it goes, so a UI can show each step live.
+
+    Puts ("backend", name), ("parse", seconds), then ("part", part, PartResult)
+    per part and finally ("done", None); a failure puts ("error", message).
+    """
+    try:
+        module = load_day_module(day_num)
+        input_text = read_input(day_num) or ""
+        backend = select_backend(module, backend, len(input_text))
+        events.put(("backend", backend))
+
+        data, parse_wall = parse_once(module, input_text, backend)
+        events.put(("parse", parse_wall))
+
+        for part in parts:
+            events.put(("part", part, run_part(module, part, data, backend)))
+    except Exception as e:
+        events.put(("error", str(e)))
+        return
+    events.put(("done", None))
+
+
+def median_timings(module, input_text, runs=3, parts=PARTS, backend=DEFAULT_BACKEND):
+    """
+    Solve a day `runs` times (uncached) and take the median of each timing.
+    Returns a DayResult whose parse_wall and per-part wall / cpu are medians;
+    the answers and errors are those of the last run.
+    """
+    samples = [solve_day(module, input_text, parts, backend) for _ in range(max(runs, 1))]
+    day_result = samples[-1]
+    day_result.parse_wall = statistics.median(s.parse_wall for s in samples)
+    for part, result in day_result.parts.items():
+        result.wall = statistics.median(s.parts[part].wall for s in samples)
+        result.cpu = statistics.median(s.parts[part].cpu for s in samples)
+    return day_result
+
+
+def format_ms(seconds):
+    return f"{seconds * 1000:.1f} ms"
+
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def top_functions(profile_path, limit=15, sort_key="tottime"):
+    """
+    The hottest functions in a pstats file, hottest first.
+    Returns a list of (function, ncalls, tottime, cumtime); sort_key is
+    "tottime" (time spent in the function itself) or "cumtime".
+    """
+    stats = pstats.Stats(profile_path).stats
+    rows = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.items():
+        if filename == "~":
+            label = name  # built-in, e.g. <method 'sort' of 'list' objects>
+        else:
+            label = f"{name} ({os.path.basename(filename)}:{line})"
+        rows.append((label, ncalls, tottime, cumtime))
+
+    column = 2 if sort_key == "tottime" else 3
+    rows.sort(key=lambda row: row[column], reverse=True)
+    return rows[:limit]
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+#
+# Answers and timings are stored per day and part under CACHE_DIR, keyed by a
+# hash of the day's source file, its input file and the interpreter / NumPy
+# versions. A day is only re-executed when one of those changes.
+# ---------------------------------------------------------------------------
+
+def environment_tag():
+    """Python and NumPy versions; part of every cache key."""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = "none"
+    return f"python-{platform.python_version()}/numpy-{numpy_version}"
+
+
+def cache_key(day_num):
+    """
+    Content hash of the day's source and input, of this runner (which does
+    the parse / backend dispatch) and the environment tag.
+    """
+    digest = hashlib.sha256()
+    for path in (script_path(day_num), input_path(day_num), os.path.abspath(__file__)):
+        digest.update(os.path.basename(path).encode())
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        digest.update(b"\0")
+    digest.update(environment_tag().encode())
+    return digest.hexdigest()
+
+
+def cache_path(day_num, part, backend=DEFAULT_BACKEND):
+    suffix = "" if backend == DEFAULT_BACKEND else f"_{backend}"
+    return os.path.join(CACHE_DIR, f"day{day_num}_part{part}{suffix}.json")
+
+
+def load_cached_part(day_num, part, key, backend=DEFAULT_BACKEND):
+    """
+    Return (parse_wall, PartResult, resolved_backend) from the cache,
+    or None on a miss.
+    """
+    try:
+        with open(cache_path(day_num, part, backend), 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if entry.get("key") != key:
+        return None
+
+    result = PartResult(answer=entry["answer"], wall=entry["wall"], cpu=entry["cpu"])
+    return entry["parse_wall"], result, entry.get("backend", backend)
+
+
+def store_cached_part(day_num, part, key, parse_wall, result,
+                      backend=DEFAULT_BACKEND, resolved=DEFAULT_BACKEND):
+    """Write one part's answer and timings. Failed or non-JSON answers are skipped."""
+    if result.error:
+        return
+
+    entry = {
+        "key": key,
+        "answer": result.answer,
+        "wall": result.wall,
+        "cpu": result.cpu,
+        "parse_wall": parse_wall,
+        "backend": resolved,
+    }
+    try:
+        payload = json.dumps(entry)
+    except TypeError:
+        return
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write then rename so concurrent workers never see a partial file
+    path = cache_path(day_num, part, backend)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def run_day_cached(day_num, parts=PARTS, use_cache=True, backend=DEFAULT_BACKEND):
+    """
+    Solve a day, serving unchanged parts from the cache.
+
+    Only the parts missing from the cache are executed (parsing once for
+    them); fresh results are written back. Results are cached per requested
+    backend name ("auto" resolves the same way for the same source and
+    input, so it is cached under its own name). Returns None if the day's
+    module does not exist.
+    """
+    if not os.path.exists(script_path(day_num)):
+        return None
+
+    key = cache_key(day_num) if use_cache else None
+    day_result = DayResult()
+
+    missing = []
+    for part in parts:
+        hit = load_cached_part(day_num, part, key, backend) if use_cache else None
+        if hit is None:
+            missing.append(part)
+        else:
+            day_result.parse_wall, day_result.parts[part], day_result.backend = hit
+
+    if not missing:
+        day_result.cached = True
+        return day_result
+
+    module = load_day_module(day_num)
+    missing = [part for part in missing if part in available_parts(module)]
+    fresh = solve_day(module, read_input(day_num) or "", parts=missing, backend=backend)
+
+    day_result.parse_wall = fresh.parse_wall
+    day_result.parse_error = fresh.parse_error
+    day_result.backend = fresh.backend
+    for part in missing:
+        day_result.parts[part] = fresh.parts[part]
+        if use_cache:
+            store_cached_part(day_num, part, key, fresh.parse_wall, fresh.parts[part],
+                              backend, fresh.backend)
+
+    # Keep the requested part order
+    day_result.parts = {part: day_result.parts[part] for part in parts
+                        if part in day_result.parts}
+    return day_result
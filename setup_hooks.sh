@@ -26,8 +26,8 @@ cat > .git/hooks/pre-push << 'EOF'
 echo "🧪 Running regression tests before push..."
 echo ""
 
-# Run the test suite
-python3 test_solutions.py
+# Run the test suite, including the timing gate against perf_baselines.json
+python3 test_solutions.py --perf
 
 # Capture exit code
 TEST_EXIT_CODE=$?
@@ -59,6 +59,7 @@ echo "The hook will:"
 echo "  • Run regression tests before every push"
 echo "  • Prevent pushing broken code"
 echo "  • Ensure all solutions remain correct"
+echo "  • Fail if a part got much slower than perf_baselines.json"
 echo ""
 echo "To bypass the hook (not recommended):"
 echo "  git push --no-verify"
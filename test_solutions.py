@@ -6,17 +6,40 @@ Runs all completed day solutions and verifies outputs match expected results.
 This ensures code changes don't break existing solutions.
 
 Usage:
-    python test_solutions.py          # Run all tests
-    python test_solutions.py --day 6  # Run specific day
+    python test_solutions.py              # Run all tests
+    python test_solutions.py --day 6      # Run specific day
+    python test_solutions.py --no-cache   # Re-run every day, ignoring cached results
+    python test_solutions.py --backend vectorized  # Use a specific backend where available
+    python test_solutions.py --backend all         # Test every backend of every day
+    python test_solutions.py --perf                # Also fail on timing regressions
+    python test_solutions.py --perf --update-baselines  # Re-record perf_baselines.json
 """
 
 import sys
 import os
-import importlib.util
+import json
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
+from benchmarks import history
+
+from runner import (DEFAULT_BACKEND, PARTS, backend_for, backend_names, check_backend,
+                    environment_tag, format_ms, input_path, load_day_module,
+                    median_timings, read_input, run_day_cached, script_path)
+
+ALL_BACKENDS = "all"
+
+# Performance gate: per-day, per-part median timings recorded in a committed file
+BASELINE_FILE = "perf_baselines.json"
+DEFAULT_PERF_RUNS = 3
+DEFAULT_PERF_RATIO = 3.0
+# Parts faster than this are too noisy to gate on
+PERF_NOISE_FLOOR = 0.005
+
 console = Console()
 
 # Expected answers for each day (Part 1, Part 2)
@@ -31,90 +54,213 @@ EXPECTED_ANSWERS = {
 }
 
 
-def load_day_module(day_num):
-    """Dynamically load a day's module."""
-    day_dir = f"day{day_num}"
-    script_path = os.path.join(day_dir, f"day{day_num}.py")
-    
-    if not os.path.exists(script_path):
-        return None
-    
-    spec = importlib.util.spec_from_file_location(f"day{day_num}", script_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[f"day{day_num}"] = module
-    spec.loader.exec_module(module)
-    
-    return module
+def checkerboard_manifold(rows, cols):
+    """Day 7 grid with S top-centre and splitters on every other cell below it."""
+    lines = []
+    for r in range(rows):
+        row = ['^' if r > 0 and (r + c) % 2 == 0 else '.' for c in range(cols)]
+        if r == 0:
+            row[cols // 2] = 'S'
+        lines.append(''.join(row))
+    return '\n'.join(lines) + '\n'
+
+
+def merged_cache_runs(module, changed_ranges=False, unwritable=False):
+    """
+    Day 5: solve_part1_cached on a cold cache, then warm (or after prepending
+    a range, or with a cache path under a regular file). Returns the
+    (cold, second) answers and whether the second run was a cache hit,
+    for comparison with solve_part1.
+    """
+    text = read_input(5)
+    second_text = "1-2\n" + text if changed_ranges else text
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "merged.bin")
+        if unwritable:
+            open(path, 'w').close()
+            path = os.path.join(path, "merged.bin")
+        cold = module.solve_part1_cached(text, path)
+        range_section, id_section = module.split_sections(second_text)
+        hit = module.count_fresh_from_cache(path, module.hash_range_section(range_section),
+                                            id_section) is not None
+        second = module.solve_part1_cached(second_text, path)
+    return (cold, second), hit
+
 
+def merged_cache_expected(module, changed_ranges=False):
+    """Answers and hit flag merged_cache_runs should produce."""
+    second_text = "1-2\n" + read_input(5) if changed_ranges else read_input(5)
+    return (module.solve_part1(read_input(5)), module.solve_part1(second_text)), not changed_ranges
 
-def read_input(day_num):
-    """Read input file for a day."""
-    input_path = os.path.join(f"day{day_num}", f"day{day_num}_input.txt")
+
+def timeline_columns_vs_dp(module, r=20, rows=50, cols=41):
+    """
+    Day 7: TimelineTable.from_columns(r) and from_cell(r, c) on a crop of
+    the real input, against count_quantum_timelines_dp with S moved to (r, c).
+    """
+    lines = read_input(7).strip().split('\n')
+    left = len(lines[0]) // 2 - cols // 2
+    crop = [list(line[left:left + cols].replace('S', '.')) for line in lines[:rows]]
     
-    if not os.path.exists(input_path):
-        return None
+    table = module.TimelineTable(module.grid_to_array(crop))
+    expected = []
+    for c in range(cols):
+        grid = [row[:] for row in crop]
+        grid[r][c] = 'S'
+        expected.append(module.count_quantum_timelines_dp(grid))
+    got = table.from_columns(r)
+    cells = [table.from_cell(r, c) for c in range(cols)]
+    return (got, cells), (expected, expected)
+
+
+def exit_distribution_sums(module, rows=66, cols=130):
+    """
+    Day 7: exact (Python int) row sums of TimelineTable.exit_distribution(0)
+    against from_columns(0), on a checkerboard whose counts pass 2**63.
+    """
+    table = module.TimelineTable(module.parse_array(checkerboard_manifold(rows, cols)))
+    dist = table.exit_distribution(0)
+    return [sum(row.tolist()) for row in dist], table.from_columns(0)
+
+
+def part2_file_answers(module, text):
+    """Day 7: solve_part2_file on text written to a temporary file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "manifold.txt")
+        with open(path, 'w') as f:
+            f.write(text)
+        return module.solve_part2_file(path)
+
+
+# Edge cases that the real inputs don't exercise: (day, description, check)
+# where check(module) returns (got, expected)
+REGRESSION_CASES = [
+    (5, "merged-interval cache: miss, then hit",
+     lambda m: (merged_cache_runs(m), merged_cache_expected(m))),
+    (5, "merged-interval cache: changed ranges invalidate it",
+     lambda m: (merged_cache_runs(m, changed_ranges=True),
+                merged_cache_expected(m, changed_ranges=True))),
+    (5, "merged-interval cache: unwritable path still solves",
+     lambda m: (merged_cache_runs(m, unwritable=True)[0], merged_cache_expected(m)[0])),
+    (6, "one-line worksheet, operators only",
+     lambda m: ((m.solve_part1(m.parse("+ *\n")), m.solve_part2(m.parse("+ *\n"))),
+                (m.solve_worksheet("+ *\n"), m.solve_worksheet_part2("+ *\n")))),
+    (6, "one-line worksheet, numbers only",
+     lambda m: (m.solve_worksheet_both("12 3\n"),
+                (m.solve_worksheet("12 3\n"), m.solve_worksheet_part2("12 3\n")))),
+    (7, "banded row blocks (2 workers) match the default part 2",
+     lambda m: (m.count_quantum_timelines_banded(m.parse_array(read_input(7)), workers=2),
+                m.solve_part2(m.parse(read_input(7))))),
+    (7, "TimelineTable.from_start matches solve_part2",
+     lambda m: (m.TimelineTable(m.parse_array(read_input(7))).from_start(),
+                m.solve_part2(m.parse(read_input(7))))),
+    (7, "TimelineTable.from_columns / from_cell match the DP from every column",
+     timeline_columns_vs_dp),
+    (7, "TimelineTable.exit_distribution rows sum exactly to from_columns",
+     exit_distribution_sums),
+    (7, "solve_part2_file streams the real input",
+     lambda m: (part2_file_answers(m, read_input(7)), m.solve_part2(m.parse(read_input(7))))),
+    (7, "solve_part2_file past 2**63 (66×130 checkerboard)",
+     lambda m: (part2_file_answers(m, checkerboard_manifold(66, 130)), 2**65)),
+    (7, "vectorized part 2 total past 2**63 (64×130 checkerboard)",
+     lambda m: (m.count_quantum_timelines_vectorized(m.parse_array(checkerboard_manifold(64, 130))),
+                2**63)),
+    (7, "vectorized part 2 total past 2**63 (66×130 checkerboard)",
+     lambda m: (m.count_quantum_timelines_vectorized(m.parse_array(checkerboard_manifold(66, 130))),
+                2**65)),
+]
+
+
+def run_regression_checks(days):
+    """Run the REGRESSION_CASES for the given days; prints failures only."""
+    failed = 0
+    for day, description, check in REGRESSION_CASES:
+        if day not in days:
+            continue
+        try:
+            got, expected = check(load_day_module(day))
+            error = None if got == expected else f"expected {expected}, got {got}"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        if error:
+            failed += 1
+            console.print(f"[red]✗ Day {day} regression: {description} - {error}[/red]")
     
-    with open(input_path, 'r') as f:
-        return f.read()
+    total = sum(1 for day, _, _ in REGRESSION_CASES if day in days)
+    if failed:
+        console.print(f"[bold red]❌ {failed}/{total} regression checks failed[/bold red]\n")
+    elif total:
+        console.print(f"[green]✓ {total} regression checks passed[/green]\n")
+    return failed == 0
 
 
-def test_day(day_num):
+def test_day(day_num, use_cache=True, backend=DEFAULT_BACKEND):
     """
     Test a specific day's solution.
-    Returns (success, part1_result, part2_result, error_message)
+    The input is parsed once (if the day has a parse hook) and shared by both parts.
+    Unless use_cache is False, answers for an unchanged day (same source, input
+    and Python/NumPy versions) are served from the result cache.
+    backend selects one of the day's BACKENDS ("auto" = fastest for the input).
+    Returns (success, part1_result, part2_result, error_message, timings, backend)
+    where timings is a "parse / part1 / part2" string and backend is the one used.
     """
-    module = load_day_module(day_num)
-    if not module:
-        return False, None, None, "Module not found"
-    
-    input_text = read_input(day_num)
-    if input_text is None:
-        return False, None, None, "Input file not found"
-    
-    expected_p1, expected_p2 = EXPECTED_ANSWERS.get(day_num, (None, None))
+    if not os.path.exists(script_path(day_num)):
+        return False, None, None, "Module not found", "", backend
     
-    # Test Part 1
-    p1_result = None
-    p1_pass = True
-    p1_error = None
+    if not os.path.exists(input_path(day_num)):
+        return False, None, None, "Input file not found", "", backend
     
-    if hasattr(module, 'solve_part1'):
-        try:
-            p1_result = module.solve_part1(input_text)
-            if expected_p1 is not None and p1_result != expected_p1:
-                p1_pass = False
-                p1_error = f"Expected {expected_p1}, got {p1_result}"
-        except Exception as e:
-            p1_pass = False
-            p1_error = str(e)
+    expected = dict(zip(PARTS, EXPECTED_ANSWERS.get(day_num, (None, None))))
     
-    # Test Part 2
-    p2_result = None
-    p2_pass = True
-    p2_error = None
+    day_result = run_day_cached(day_num, use_cache=use_cache, backend=backend)
     
-    if hasattr(module, 'solve_part2'):
-        try:
-            p2_result = module.solve_part2(input_text)
-            if expected_p2 is not None and p2_result != expected_p2:
-                p2_pass = False
-                p2_error = f"Expected {expected_p2}, got {p2_result}"
-        except Exception as e:
-            p2_pass = False
-            p2_error = str(e)
+    results = {}
+    errors = {}
+    for part in PARTS:
+        result = day_result.parts.get(part)
+        if result is None:
+            results[part] = None
+            continue
+        
+        results[part] = result.answer
+        if result.error:
+            errors[part] = result.error
+        elif expected[part] is not None and result.answer != expected[part]:
+            errors[part] = f"Expected {expected[part]}, got {result.answer}"
     
-    success = p1_pass and p2_pass
+    success = not errors
     error_msg = None
     if not success:
-        error_msg = f"P1: {p1_error or 'OK'}, P2: {p2_error or 'OK'}"
+        error_msg = f"P1: {errors.get(1, 'OK')}, P2: {errors.get(2, 'OK')}"
+    
+    timings = " / ".join(
+        [format_ms(day_result.parse_wall)]
+        + [format_ms(r.wall) for r in day_result.parts.values()]
+    )
+    if day_result.cached:
+        timings += " (cached)"
     
-    return success, p1_result, p2_result, error_msg
+    return success, results[1], results[2], error_msg, timings, day_result.backend
+
+
+def backends_to_test(day_num, backend):
+    """
+    Backend names to run for a day; "all" expands to every backend it
+    declares, and a name the day doesn't declare runs its default.
+    """
+    module = load_day_module(day_num)
+    if module is None:
+        return [DEFAULT_BACKEND if backend == ALL_BACKENDS else backend]
+    if backend == ALL_BACKENDS:
+        return backend_names(module)
+    return [backend_for(module, backend)]
 
 
-def run_all_tests():
+def run_all_tests(use_cache=True, backend=DEFAULT_BACKEND):
     """Run tests for all completed days."""
     days_to_test = [day for day in EXPECTED_ANSWERS.keys() 
                     if EXPECTED_ANSWERS[day] != (None, None)]
+    runs = [(day, name) for day in days_to_test for name in backends_to_test(day, backend)]
     
     console.print("\n[bold cyan]🧪 Running Regression Test Suite[/bold cyan]\n")
     
@@ -128,12 +274,12 @@ def run_all_tests():
         transient=False,
     ) as progress:
         
-        task = progress.add_task("[cyan]Testing days...", total=len(days_to_test))
+        task = progress.add_task("[cyan]Testing days...", total=len(runs))
         
-        for day in days_to_test:
+        for day, name in runs:
             progress.update(task, description=f"[cyan]Testing Day {day}...")
-            success, p1, p2, error = test_day(day)
-            results.append((day, success, p1, p2, error))
+            success, p1, p2, error, timings, used = test_day(day, use_cache, name)
+            results.append((day, success, p1, p2, error, timings, used))
             progress.advance(task)
     
     # Display results table
@@ -142,12 +288,13 @@ def run_all_tests():
     table.add_column("Status", style="bold")
     table.add_column("Part 1", justify="right")
     table.add_column("Part 2", justify="right")
+    table.add_column("Parse / P1 / P2", justify="right", style="dim", no_wrap=True)
     table.add_column("Notes", style="dim")
     
     passed = 0
     failed = 0
     
-    for day, success, p1, p2, error in results:
+    for day, success, p1, p2, error, timings, used in results:
         if success:
             passed += 1
             status = "[green]✓ PASS[/green]"
@@ -157,11 +304,13 @@ def run_all_tests():
             status = "[red]✗ FAIL[/red]"
             notes = error or ""
         
+        label = f"{day}" if used == DEFAULT_BACKEND else f"{day} ({used})"
         table.add_row(
-            f"{day}",
+            label,
             status,
             str(p1) if p1 is not None else "-",
             str(p2) if p2 is not None else "-",
+            timings,
             notes
         )
     
@@ -177,40 +326,200 @@ def run_all_tests():
     return failed == 0
 
 
-def run_single_test(day_num):
-    """Run test for a single day."""
+def run_single_test(day_num, use_cache=True, backend=DEFAULT_BACKEND):
+    """Run test for a single day (once per backend when backend is "all")."""
     console.print(f"\n[bold cyan]🧪 Testing Day {day_num}[/bold cyan]\n")
     
-    success, p1, p2, error = test_day(day_num)
+    all_passed = True
+    for name in backends_to_test(day_num, backend):
+        all_passed &= report_single_test(day_num, use_cache, name)
+    
+    console.print()
+    return all_passed
+
+
+def report_single_test(day_num, use_cache, backend):
+    """Run and print one backend's result for a day."""
+    success, p1, p2, error, timings, used = test_day(day_num, use_cache, backend)
+    label = f"Day {day_num}" if used == DEFAULT_BACKEND else f"Day {day_num} ({used})"
     
     if success:
-        console.print(f"[green]✓ Day {day_num} - PASS[/green]")
+        console.print(f"[green]✓ {label} - PASS[/green]")
         console.print(f"  Part 1: {p1}")
         console.print(f"  Part 2: {p2}")
+        console.print(f"  [dim]Parse / P1 / P2: {timings}[/dim]")
     else:
-        console.print(f"[red]✗ Day {day_num} - FAIL[/red]")
+        console.print(f"[red]✗ {label} - FAIL[/red]")
         console.print(f"  {error}")
     
-    console.print()
     return success
 
 
+def measure_day(day_num, backend, runs):
+    """
+    Median timings of one day over `runs` uncached runs; executed in a worker process.
+    Returns (day, DayResult_or_None, error_or_None).
+    """
+    module = load_day_module(day_num)
+    input_text = read_input(day_num)
+    if module is None or input_text is None:
+        return day_num, None, "Module or input not found"
+
+    day_result = median_timings(module, input_text, runs, backend=backend)
+    errors = [f"P{part}: {r.error}" for part, r in day_result.parts.items() if r.error]
+    return day_num, day_result, ", ".join(errors) or None
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE, 'r') as f:
+        return json.load(f)
+
+
+def save_baselines(baselines):
+    with open(BASELINE_FILE, 'w') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def run_perf_gate(days, backend=DEFAULT_BACKEND, runs=DEFAULT_PERF_RUNS, ratio=None,
+                  workers=None, update=False, record=False):
+    """
+    Time each day's parse and parts (median of `runs`) in worker processes and
+    compare them with BASELINE_FILE. A step fails when it is more than `ratio`
+    times slower than its baseline (and above PERF_NOISE_FLOOR). With update=True the
+    measured medians are written back as the new baselines instead.
+    Steps without a baseline are reported as new and never fail.
+    With record=True the medians are also appended to the benchmark history.
+    """
+    baselines = load_baselines()
+    if ratio is None:
+        ratio = baselines.get("ratio", DEFAULT_PERF_RATIO)
+    recorded = baselines.setdefault("timings", {})
+
+    tasks = [(day, name) for day in days for name in backends_to_test(day, backend)]
+    console.print(f"\n[bold cyan]⏱️  Performance gate[/bold cyan] "
+                  f"[dim](median of {runs}, fail above {ratio:g}× baseline)[/dim]\n")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        measured = list(pool.map(measure_day, *zip(*tasks), [runs] * len(tasks)))
+
+    table = Table(title="⏱️  Timing vs Baseline")
+    table.add_column("Day", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Step", justify="right")
+    table.add_column("Baseline", justify="right", style="dim")
+    table.add_column("Median", justify="right")
+    table.add_column("Ratio", justify="right")
+    table.add_column("Status", style="bold")
+
+    regressions = 0
+    for (day, name), (_, day_result, error) in zip(tasks, measured):
+        used = day_result.backend if day_result else name
+        label = f"{day}" if used == DEFAULT_BACKEND else f"{day} ({used})"
+        if error:
+            regressions += 1
+            table.add_row(label, "-", "-", "-", "-", f"[red]✗ {error}[/red]")
+            continue
+
+        walls = {"parse": day_result.parse_wall}
+        walls.update((f"part{part}", r.wall) for part, r in day_result.parts.items())
+        day_baselines = recorded.setdefault(f"day{day}", {}).setdefault(used, {})
+        for key, wall in walls.items():
+            baseline = day_baselines.get(key)
+            if update:
+                day_baselines[key] = round(wall, 6)
+                status = "[blue]recorded[/blue]"
+            elif baseline is None:
+                status = "[yellow]new (no baseline)[/yellow]"
+            elif wall > baseline * ratio and wall > PERF_NOISE_FLOOR:
+                regressions += 1
+                status = "[red]✗ REGRESSED[/red]"
+            else:
+                status = "[green]✓ OK[/green]"
+
+            shown_ratio = f"{wall / baseline:.2f}×" if baseline else "-"
+            shown_baseline = format_ms(baseline) if baseline is not None else "-"
+            step = key if key == "parse" else key[4:]
+            table.add_row(label, step, shown_baseline, format_ms(wall), shown_ratio, status)
+
+    console.print(table)
+
+    if record:
+        commit, dirty = history.current_commit()
+        machine = history.machine_fingerprint()
+        records = []
+        for day, day_result, error in measured:
+            if day_result is not None:
+                records.extend(history.make_records(day_result, day, runs, commit, dirty, machine))
+        history.append_records(records)
+        console.print(f"[dim]Recorded {len(records)} timings in {history.HISTORY_FILE}[/dim]")
+
+    if update:
+        baselines["runs"] = runs
+        baselines["environment"] = environment_tag()
+        baselines.setdefault("ratio", DEFAULT_PERF_RATIO)
+        save_baselines(baselines)
+        console.print(f"\n[bold blue]📝 Baselines written to {BASELINE_FILE}[/bold blue]\n")
+        return True
+
+    if regressions:
+        console.print(f"\n[bold red]❌ {regressions} performance regression(s)[/bold red]\n")
+    else:
+        console.print("\n[bold green]✨ No performance regressions ✨[/bold green]\n")
+    return regressions == 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Regression tests for Advent of Code 2025")
+    parser.add_argument("--day", type=int, help="Test only this day")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every day instead of serving unchanged ones from the cache")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND,
+                        help='Backend to test: a name from the day\'s BACKENDS, "auto", '
+                             'or "all" to test every backend')
+    parser.add_argument("--perf", action="store_true",
+                        help=f"Also time parsing and every part and fail on regressions against {BASELINE_FILE}")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help=f"Re-record {BASELINE_FILE} from this machine (implies --perf)")
+    parser.add_argument("--perf-runs", type=int, default=DEFAULT_PERF_RUNS,
+                        help=f"Runs per part; the median is compared (default: {DEFAULT_PERF_RUNS})")
+    parser.add_argument("--perf-ratio", type=float, default=None,
+                        help="Fail when a part is this many times slower than its baseline "
+                             f"(default: the file's \"ratio\", else {DEFAULT_PERF_RATIO:g})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for the perf gate (default: CPU count)")
+    parser.add_argument("--record", action="store_true",
+                        help="With --perf, also append the timings to the benchmark history")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    use_cache = not args.no_cache
+    
     # Check for specific day argument
-    if len(sys.argv) > 1 and sys.argv[1] == "--day":
-        if len(sys.argv) > 2:
-            try:
-                day = int(sys.argv[2])
-                success = run_single_test(day)
-                sys.exit(0 if success else 1)
-            except ValueError:
-                console.print("[red]Invalid day number[/red]")
-                sys.exit(1)
-        else:
-            console.print("[red]Please specify a day number: --day <num>[/red]")
-            sys.exit(1)
+    if args.day is not None:
+        days = [args.day]
+    else:
+        days = [day for day, answers in EXPECTED_ANSWERS.items() if answers != (None, None)]
     
-    # Run all tests
-    success = run_all_tests()
+    try:
+        check_backend(args.backend, [m for m in map(load_day_module, days) if m],
+                      extra=(ALL_BACKENDS,))
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(2)
+    
+    if args.day is not None:
+        success = run_single_test(args.day, use_cache, args.backend)
+    else:
+        # Run all tests
+        success = run_all_tests(use_cache, args.backend)
+    
+    success = run_regression_checks(days) and success
+    
+    if success and (args.perf or args.update_baselines):
+        success = run_perf_gate(days, args.backend, args.perf_runs, args.perf_ratio,
+                                args.workers, args.update_baselines, args.record)
     sys.exit(0 if success else 1)
-